@@ -0,0 +1,154 @@
+import os
+import stat
+import types
+
+import pytest
+
+import ttsfm.cli as cli
+from ttsfm.models import AudioFormat, TTSRequest, TTSResponse, Voice
+from ttsfm.utils import split_text_by_length
+
+
+class _FakeClient:
+    def __init__(self, **kwargs):
+        self.requests = []
+
+    def generate_speech_from_request(self, request):
+        self.requests.append(request)
+        data = request.input.encode()
+        return TTSResponse(
+            audio_data=data,
+            content_type="audio/mpeg",
+            format=AudioFormat.MP3,
+            size=len(data),
+        )
+
+
+def _make_args(output, **overrides):
+    values = dict(
+        url="http://localhost:7000",
+        api_key=None,
+        timeout=30.0,
+        retries=3,
+        max_length=20,
+        auto_combine=False,
+        chunk_concurrency=4,
+        verbose=False,
+        output=str(output),
+    )
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+
+def test_handle_long_text_writes_one_file_per_chunk(monkeypatch, tmp_path):
+    fake = _FakeClient()
+    monkeypatch.setattr(cli, "TTSClient", lambda **kwargs: fake)
+
+    text = "First sentence here. Second sentence here. Third one."
+    args = _make_args(tmp_path / "speech.mp3")
+
+    cli.handle_long_text(args, text, Voice.ALLOY, AudioFormat.MP3, 1.0)
+
+    parts = sorted(tmp_path.glob("speech_part*.mp3"))
+    expected = split_text_by_length(text, 20)
+    assert len(parts) == len(fake.requests) == len(expected) > 1
+    assert [p.read_bytes().decode() for p in parts] == expected
+
+
+def test_handle_long_text_single_chunk_uses_output_name(monkeypatch, tmp_path):
+    fake = _FakeClient()
+    monkeypatch.setattr(cli, "TTSClient", lambda **kwargs: fake)
+
+    args = _make_args(tmp_path / "speech.mp3", max_length=1000)
+
+    cli.handle_long_text(args, "Short text.", Voice.ALLOY, AudioFormat.MP3, 1.0)
+
+    assert (tmp_path / "speech.mp3").read_bytes() == b"Short text."
+
+
+@pytest.mark.parametrize("value, expected", [("nova", Voice.NOVA), ("SAGE", Voice.SAGE)])
+def test_get_voice_enum(value, expected):
+    assert cli.get_voice_enum(value) is expected
+
+
+def test_read_text_file_strips_whitespace(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("  hello world\n\n", encoding="utf-8")
+
+    assert cli.read_text_file(str(path)) == "hello world"
+
+
+def test_parser_is_reused_between_calls():
+    assert cli._get_parser() is cli._get_parser()
+    args = cli._get_parser().parse_args(["hello", "--output", "out.mp3"])
+    assert args.text == "hello"
+    assert cli._get_parser().parse_args(["--text-file", "in.txt", "-o", "x.wav"]).text is None
+
+
+def test_write_audio_file_truncates_existing_file(tmp_path):
+    path = tmp_path / "out.mp3"
+    path.write_bytes(b"x" * 100)
+
+    cli.write_audio_file(str(path), b"ID3" + b"\x00" * 10)
+
+    assert path.read_bytes() == b"ID3" + b"\x00" * 10
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_write_audio_file_honours_umask(tmp_path):
+    path = tmp_path / "out.mp3"
+    previous = os.umask(0o002)
+    try:
+        cli.write_audio_file(str(path), b"ID3")
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o664
+
+
+def test_handle_long_text_auto_combine_saves_single_file(monkeypatch, tmp_path):
+    class _CombiningClient(_FakeClient):
+        def generate_speech_long_text(self, text, **kwargs):
+            assert kwargs["auto_combine"] is True
+            return _FakeClient.generate_speech_from_request(self, TTSRequest(input=text))
+
+    monkeypatch.setattr(cli, "TTSClient", lambda **kwargs: _CombiningClient())
+
+    args = _make_args(tmp_path / "speech.mp3", auto_combine=True)
+    cli.handle_long_text(args, "Some long text.", Voice.ALLOY, AudioFormat.MP3, 1.0)
+
+    assert (tmp_path / "speech.mp3").read_bytes() == b"Some long text."
+
+
+def test_handle_long_text_bounds_chunks_in_flight(monkeypatch, tmp_path):
+    import time
+
+    fake = _FakeClient()
+    completed = []
+
+    def slow_generate(request):
+        time.sleep(0.005)
+        response = _FakeClient.generate_speech_from_request(fake, request)
+        completed.append(request)
+        return response
+
+    fake.generate_speech_from_request = slow_generate
+    monkeypatch.setattr(cli, "TTSClient", lambda **kwargs: fake)
+
+    ahead = []
+    real_iter = cli.split_text_by_length_iter
+
+    def tracking_iter(*args, **kwargs):
+        for pulled, chunk in enumerate(real_iter(*args, **kwargs), 1):
+            ahead.append(pulled - len(completed))
+            yield chunk
+
+    monkeypatch.setattr(cli, "split_text_by_length_iter", tracking_iter)
+
+    text = " ".join(f"Sentence number {n}." for n in range(30))
+    args = _make_args(tmp_path / "speech.mp3", chunk_concurrency=2)
+    cli.handle_long_text(args, text, Voice.ALLOY, AudioFormat.MP3, 1.0)
+
+    assert len(list(tmp_path.glob("speech_part*.mp3"))) == len(ahead) > 10
+    # Splitting never runs more than the window (plus the chunk being queued) ahead
+    assert max(ahead) <= 3
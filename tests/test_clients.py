@@ -1,10 +1,15 @@
+import os
+import time
 import types
+import uuid
 
 import pytest
 
 from ttsfm.async_client import AsyncTTSClient
+from ttsfm.cache import ResponseCache, make_cache_key
 from ttsfm.client import TTSClient
-from ttsfm.models import AudioFormat, TTSResponse
+from ttsfm.models import DEFAULT_PROMPT, AudioFormat, TTSRequest, TTSResponse, Voice
+from ttsfm.utils import split_text_by_length
 
 
 def _mk_response(data: bytes) -> TTSResponse:
@@ -17,22 +22,32 @@ def _mk_response(data: bytes) -> TTSResponse:
 
 
 class _DummyResponse:
-    def __init__(self, content_type: str, content: bytes, url: str = "https://example.test/audio"):
-        self.status_code = 200
+    def __init__(
+        self,
+        content_type: str,
+        content: bytes,
+        url: str = "https://example.test/audio",
+        status_code: int = 200,
+    ):
+        self.status_code = status_code
         self.headers = {"content-type": content_type}
         self.content = content
         self.url = url
         self.text = ""
 
-    def json(self):  # pragma: no cover - not used on success path
-        return {}
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self):
+        self.closed = True
 
 
 def test_sync_request_normalizes_non_mp3_format(monkeypatch):
     client = TTSClient()
     captured = {}
 
-    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None):
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
         captured["data"] = data
         return _DummyResponse("audio/wav", b"RIFF" + b"\x00" * 64, url)
 
@@ -48,7 +63,7 @@ def test_sync_request_preserves_mp3_format(monkeypatch):
     client = TTSClient()
     captured = {}
 
-    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None):
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
         captured["data"] = data
         return _DummyResponse("audio/mpeg", b"ID3" + b"\x00" * 64, url)
 
@@ -60,6 +75,30 @@ def test_sync_request_preserves_mp3_format(monkeypatch):
     assert response.format is AudioFormat.MP3
 
 
+def test_sync_request_error_status_raises_without_python_retries(monkeypatch):
+    from ttsfm.exceptions import RateLimitException
+
+    client = TTSClient(max_retries=3)
+    calls = []
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        calls.append(url)
+        return _DummyResponse(
+            "application/json",
+            b'{"error": {"message": "slow down"}}',
+            url,
+            status_code=429,
+        )
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    with pytest.raises(RateLimitException, match="slow down"):
+        client.generate_speech(text="hello")
+
+    # Retrying retryable statuses is left to the adapter's urllib3 Retry policy
+    assert len(calls) == 1
+
+
 def test_sync_long_text_auto_combine(monkeypatch):
     client = TTSClient()
 
@@ -119,3 +158,614 @@ async def test_async_long_text_auto_combine(monkeypatch):
 
     assert isinstance(result, TTSResponse)
     assert result.audio_data == b"onetwo"
+
+
+def test_dns_cache_reuses_lookups_until_invalidated(monkeypatch):
+    from ttsfm.dns_cache import DNSCache
+
+    calls = []
+
+    def fake_getaddrinfo(host, port, family=0, type=0):
+        calls.append(host)
+        return [(2, 1, 6, "", ("203.0.113.7", port)), (2, 1, 6, "", ("203.0.113.7", port))]
+
+    monkeypatch.setattr("ttsfm.dns_cache.socket.getaddrinfo", fake_getaddrinfo)
+
+    cache = DNSCache(ttl=60)
+    assert cache.resolve("tts.example", 443) == ["203.0.113.7"]
+    assert cache.resolve("tts.example", 443) == ["203.0.113.7"]
+    assert calls == ["tts.example"]
+
+    cache.invalidate("tts.example")
+    cache.resolve("tts.example", 443)
+    assert calls == ["tts.example", "tts.example"]
+
+
+def test_dns_cache_is_opt_in():
+    from ttsfm.dns_cache import DNSCachingAdapter
+
+    assert not isinstance(TTSClient().session.get_adapter("https://x"), DNSCachingAdapter)
+    assert isinstance(
+        TTSClient(dns_cache_ttl=300).session.get_adapter("https://x"), DNSCachingAdapter
+    )
+
+
+@pytest.mark.parametrize(
+    "client_kwargs, batch_kwargs",
+    [({}, {"max_concurrency": 3}), ({"batch_concurrency": 3}, {})],
+)
+def test_sync_batch_runs_chunks_concurrently_in_order(monkeypatch, client_kwargs, batch_kwargs):
+    import threading
+    import time
+
+    client = TTSClient(**client_kwargs)
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return _DummyResponse("audio/mpeg", data["input"].encode(), url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    text = " ".join(f"Sentence number {i}." for i in range(12))
+    responses = client.generate_speech_batch(text=text, max_length=40, **batch_kwargs)
+
+    assert b" ".join(r.audio_data for r in responses).decode() == text
+    assert 1 < active["peak"] <= 3
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        ("audio/mpeg", AudioFormat.MP3),
+        ("audio/wav; charset=binary", AudioFormat.WAV),
+        ("Audio/X-WAV", AudioFormat.WAV),
+        ("audio/ogg", AudioFormat.OPUS),
+        ("application/octet-stream", AudioFormat.MP3),
+    ],
+)
+def test_response_format_detected_from_content_type(content_type, expected):
+    client = TTSClient()
+    request = TTSRequest(input="hi", voice=Voice.ALLOY, response_format=expected)
+
+    response = client._process_openai_fm_response(
+        _DummyResponse(content_type, b"\x00" * 16, "https://example.com"), request
+    )
+
+    assert response.format is expected
+
+
+def test_response_headers_are_opt_in_and_whitelisted():
+    request = TTSRequest(input="hi", voice=Voice.ALLOY, response_format=AudioFormat.MP3)
+    dummy = _DummyResponse("audio/mpeg", b"\x00" * 16)
+    dummy.headers.update({"x-request-id": "abc", "set-cookie": "secret"})
+
+    default = TTSClient()._process_openai_fm_response(dummy, request)
+    assert "response_headers" not in default.metadata
+
+    opted_in = TTSClient(include_response_headers=True)._process_openai_fm_response(dummy, request)
+    assert opted_in.metadata["response_headers"] == {
+        "content-type": "audio/mpeg",
+        "x-request-id": "abc",
+    }
+
+
+def test_legacy_metadata_keeps_removed_keys_with_a_warning():
+    request = TTSRequest(input="x" * 150, voice=Voice.ALLOY, response_format=AudioFormat.MP3)
+    dummy = _DummyResponse("audio/mpeg", b"\x00" * 16)
+    dummy.headers["set-cookie"] = "kept"
+
+    with pytest.warns(DeprecationWarning, match="legacy_metadata"):
+        client = TTSClient(legacy_metadata=True)
+    metadata = client._process_openai_fm_response(dummy, request).metadata
+
+    assert metadata["original_text"] == "x" * 100 + "..."
+    assert metadata["text_length"] == 150
+    assert metadata["response_headers"] == dummy.headers
+
+
+@pytest.mark.asyncio
+async def test_async_client_builds_the_same_response_as_the_sync_client():
+    request = TTSRequest(input="hi", voice=Voice.ALLOY, response_format=AudioFormat.MP3)
+    dummy = _DummyResponse("audio/mpeg", b"\x00" * 16)
+
+    class _FakeAsyncResponse:
+        status = dummy.status_code
+        headers = dummy.headers
+        url = dummy.url
+
+        async def read(self):
+            return dummy.content
+
+    client = AsyncTTSClient(include_response_headers=True)
+    async_response = await client._process_openai_fm_response(_FakeAsyncResponse(), request)
+    sync_response = TTSClient(include_response_headers=True)._process_openai_fm_response(
+        dummy, request
+    )
+
+    assert async_response == sync_response
+
+
+def test_format_headers_are_shared_read_only_mappings():
+    client = TTSClient()
+
+    mp3 = client._get_headers_for_format(AudioFormat.MP3)
+    wav = client._get_headers_for_format(AudioFormat.OPUS)
+
+    assert mp3 is client._get_headers_for_format(AudioFormat.MP3)
+    assert "Accept" in wav and "Accept" not in mp3
+    with pytest.raises(TypeError):
+        mp3["Accept"] = "*/*"
+
+
+def test_response_cache_serves_repeat_requests(monkeypatch):
+    client = TTSClient(cache_size=8)
+    calls = []
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        calls.append(data["input"])
+        return _DummyResponse("audio/mpeg", b"ID3" + data["input"].encode(), url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    first = client.generate_speech(text="hello", voice="alloy", response_format=AudioFormat.MP3)
+    first.metadata["mutated"] = True
+    second = client.generate_speech(text="hello", voice="alloy", response_format=AudioFormat.MP3)
+    client.generate_speech(text="hello", voice="nova", response_format=AudioFormat.MP3)
+
+    assert calls == ["hello", "hello"]
+    assert second.audio_data == first.audio_data
+    assert "mutated" not in second.metadata
+
+    client.clear_cache()
+    client.generate_speech(text="hello", voice="alloy", response_format=AudioFormat.MP3)
+    assert len(calls) == 3
+
+
+def test_response_cache_evicts_by_byte_budget():
+    cache = ResponseCache(max_entries=10, max_bytes=10)
+    for key in (b"a", b"b", b"c"):
+        cache.put(key, TTSResponse(b"x" * 4, "audio/mpeg", AudioFormat.MP3, 4))
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"c") is not None
+    assert cache.size == 8
+
+
+def test_http2_requires_httpx(monkeypatch):
+    import ttsfm.client as client_module
+
+    monkeypatch.setattr(client_module, "httpx", None)
+
+    with pytest.raises(RuntimeError, match="httpx"):
+        TTSClient(http2=True)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, None),
+        ({"use_default_prompt": True}, DEFAULT_PROMPT),
+        ({"default_prompt": "Speak slowly."}, "Speak slowly."),
+    ],
+)
+def test_default_prompt_fallback(monkeypatch, kwargs, expected):
+    client = TTSClient(**kwargs)
+    captured = {}
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kw):
+        captured["data"] = data
+        return _DummyResponse("audio/mpeg", b"ID3" + b"\x00" * 16, url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    client.generate_speech(text="hello", response_format=AudioFormat.MP3)
+    assert captured["data"].get("prompt") == expected
+
+    client.generate_speech(text="hi", response_format=AudioFormat.MP3, instructions="Whisper.")
+    assert captured["data"]["prompt"] == "Whisper."
+
+
+@pytest.mark.parametrize("dns_cache_ttl", [300.0, None])
+def test_pooled_connections_enable_tcp_keepalive(dns_cache_ttl):
+    import socket
+
+    client = TTSClient(dns_cache_ttl=dns_cache_ttl)
+    adapter = client.session.get_adapter("https://www.openai.fm")
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+
+def test_any_2xx_status_is_processed_as_audio(monkeypatch):
+    client = TTSClient()
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        return _DummyResponse("audio/mpeg", b"ID3" + b"\x00" * 16, url, status_code=203)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    response = client.generate_speech(text="hello", response_format=AudioFormat.MP3)
+
+    assert response.audio_data.startswith(b"ID3")
+
+
+def test_response_cache_persists_to_directory(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        calls.append(data["input"])
+        return _DummyResponse("audio/mpeg", b"ID3" + data["input"].encode(), url)
+
+    first_client = TTSClient(cache_dir=str(tmp_path))
+    monkeypatch.setattr(
+        first_client.session, "post", types.MethodType(fake_post, first_client.session)
+    )
+    first = first_client.generate_speech(text="hello", response_format=AudioFormat.MP3)
+
+    # A fresh client (e.g. another process) is served from the directory
+    second_client = TTSClient(cache_dir=str(tmp_path))
+    monkeypatch.setattr(
+        second_client.session, "post", types.MethodType(fake_post, second_client.session)
+    )
+    second = second_client.generate_speech(text="hello", response_format=AudioFormat.MP3)
+
+    assert calls == ["hello"]
+    assert second.audio_data == first.audio_data
+    assert second.format is AudioFormat.MP3
+    assert second.metadata["voice"] == first.metadata["voice"]
+
+    second_client.clear_cache()
+    assert not list(tmp_path.iterdir())
+
+
+def test_response_cache_entries_expire_after_ttl(monkeypatch):
+    import ttsfm.cache as cache_module
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["t"])
+    cache = ResponseCache(max_entries=4, ttl=10)
+    cache.put(b"k", TTSResponse(b"abc", "audio/mpeg", AudioFormat.MP3, 3))
+
+    now["t"] += 5
+    assert cache.get(b"k") is not None
+    now["t"] += 10
+    assert cache.get(b"k") is None
+    assert cache.size == 0
+
+
+def test_cache_key_depends_on_base_url():
+    assert make_cache_key("https://a.example", "hi", "alloy", "mp3") != make_cache_key(
+        "https://b.example", "hi", "alloy", "mp3"
+    )
+
+
+def test_response_cache_clear_keeps_unrelated_files(tmp_path):
+    cache = ResponseCache(max_entries=0, directory=tmp_path)
+    cache.put(bytes(16), TTSResponse(b"abc", "audio/mpeg", AudioFormat.MP3, 3))
+    (tmp_path / "notes.json").write_text("{}")
+    (tmp_path / "song.bin").write_bytes(b"\x00")
+
+    cache.clear()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["notes.json", "song.bin"]
+
+
+def test_response_cache_directory_stays_within_byte_budget(tmp_path):
+    cache = ResponseCache(max_entries=0, directory=tmp_path)
+    keys = [bytes([i]) * 16 for i in range(3)]
+    for age, key in zip((300, 200), keys):
+        cache.put(key, TTSResponse(b"x" * 100, "audio/mpeg", AudioFormat.MP3, 100))
+        audio_path = tmp_path / f"{key.hex()}.bin"
+        os.utime(audio_path, (time.time() - age, time.time() - age))
+    entry_size = sum(path.stat().st_size for path in tmp_path.iterdir()) // 2
+
+    cache.max_disk_bytes = 2 * entry_size
+    cache.put(keys[2], TTSResponse(b"x" * 100, "audio/mpeg", AudioFormat.MP3, 100))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is not None
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_response_cache_directory_respects_ttl(monkeypatch, tmp_path):
+    import ttsfm.cache as cache_module
+
+    fresh, stale = bytes(16), b"\xff" * 16
+    writer = ResponseCache(max_entries=0, directory=tmp_path)
+    for key, age in ((fresh, 8), (stale, 20)):
+        writer.put(key, TTSResponse(b"abc", "audio/mpeg", AudioFormat.MP3, 3))
+        audio_path = tmp_path / f"{key.hex()}.bin"
+        os.utime(audio_path, (time.time() - age, time.time() - age))
+
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: 1000.0)
+    cache = ResponseCache(max_entries=4, directory=tmp_path, ttl=10)
+
+    assert cache.get(stale) is None
+    assert not list(tmp_path.glob(f"{stale.hex()}.*"))
+
+    # A promoted entry keeps the age it had on disk
+    assert cache.get(fresh) is not None
+    assert cache._entries[fresh][0] == pytest.approx(992.0, abs=1.0)
+
+
+@pytest.mark.parametrize("announced", [None, 200_000, 70_000, 300_000])
+def test_read_response_body_handles_announced_length(announced):
+    from ttsfm.client import _read_response_body
+
+    body = bytes(range(256)) * 800  # several streaming chunks
+    dummy = _DummyResponse("audio/mpeg", body)
+    if announced is not None:
+        dummy.headers["content-length"] = str(announced)
+
+    assert _read_response_body(dummy) == body
+
+
+def test_request_functions_are_compiled_once_per_shape(monkeypatch):
+    client = TTSClient()
+    compiled = []
+    compile_request_fn = client._compile_request_fn
+
+    def counting_compile(*args):
+        compiled.append(args)
+        return compile_request_fn(*args)
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        return _DummyResponse("audio/mpeg", b"ID3" + b"\x00" * 16, url)
+
+    monkeypatch.setattr(client, "_compile_request_fn", counting_compile)
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    for text in ("one", "two", "three"):
+        client.generate_speech(text=text, response_format=AudioFormat.MP3)
+    client.generate_speech(text="four", voice="nova", response_format=AudioFormat.MP3)
+
+    assert compiled == [
+        (Voice.ALLOY, AudioFormat.MP3, None),
+        (Voice.NOVA, AudioFormat.MP3, None),
+    ]
+
+
+def test_generation_ids_are_unique_per_request(monkeypatch):
+    client = TTSClient()
+    generations = []
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        generations.append(data["generation"])
+        return _DummyResponse("audio/mpeg", b"ID3" + b"\x00" * 16, url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    for _ in range(3):
+        client.generate_speech(text="hello", response_format=AudioFormat.MP3)
+
+    ids = [uuid.UUID(generation) for generation in generations]
+    assert [str(generation_id) for generation_id in ids] == generations
+    assert all(generation_id.version == 4 for generation_id in ids)
+    assert len(set(generations)) == 3
+    assert len({generation_id.int >> 64 for generation_id in ids}) == 1
+    assert TTSClient()._generation_prefix != client._generation_prefix
+
+
+def test_connection_pool_fits_batch_concurrency():
+    client = TTSClient(pool_maxsize=2, batch_concurrency=16)
+    adapter = client.session.get_adapter("https://www.openai.fm")
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 16
+    assert client.session.headers["Connection"] == "keep-alive"
+
+
+@pytest.mark.parametrize("estimate_duration", [True, False])
+def test_duration_estimate_can_be_disabled(estimate_duration):
+    request = TTSRequest(input="one two three", voice=Voice.ALLOY, response_format=AudioFormat.MP3)
+    client = TTSClient(estimate_duration=estimate_duration)
+
+    response = client._process_openai_fm_response(
+        _DummyResponse("audio/mpeg", b"\x00" * 16), request
+    )
+
+    assert (response.duration is not None) is estimate_duration
+
+
+def test_batch_concat_joins_chunks_without_reencoding(monkeypatch):
+    client = TTSClient()
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        return _DummyResponse("audio/mpeg", data["input"].encode(), url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    text = " ".join(f"Sentence number {i}." for i in range(6))
+    response = client.generate_speech_batch_concat(text=text, max_length=40)
+
+    chunks = split_text_by_length(text, 40)
+    assert response.audio_data == "".join(chunks).encode()
+    assert response.size == len(response.audio_data)
+    assert response.metadata["chunks_combined"] > 1
+
+
+@pytest.mark.parametrize("skip_sanitize, expected", [(False, "a & b"), (True, "a &amp; b")])
+def test_skip_sanitize_sends_text_as_is(monkeypatch, skip_sanitize, expected):
+    client = TTSClient()
+    captured = {}
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        captured["data"] = data
+        return _DummyResponse("audio/mpeg", b"\x00" * 16, url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    client.generate_speech(text="a &amp; b", skip_sanitize=skip_sanitize)
+
+    assert captured["data"]["input"] == expected
+
+
+def test_with_input_copies_validated_request():
+    template = TTSRequest(input="first", voice="nova", response_format="wav", speed=1.5)
+
+    clone = template.with_input("second")
+
+    assert (clone.input, template.input) == ("second", "first")
+    assert clone.voice is Voice.NOVA and clone.response_format is AudioFormat.WAV
+    assert clone.speed == 1.5
+
+
+def test_error_body_that_is_not_json_becomes_the_message(monkeypatch):
+    from ttsfm.exceptions import MAX_ERROR_MESSAGE_BYTES, APIException
+
+    client = TTSClient()
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        return _DummyResponse(
+            "text/html", b"upstream exploded" + b"!" * 10_000, url, status_code=500
+        )
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    with pytest.raises(APIException, match="upstream exploded") as excinfo:
+        client.generate_speech(text="hello")
+
+    assert len(excinfo.value.message) == MAX_ERROR_MESSAGE_BYTES
+
+
+def test_ssl_verification_is_configured_on_the_session(monkeypatch):
+    client = TTSClient(verify_ssl=False)
+    captured = {}
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        captured["verify"] = verify
+        return _DummyResponse("audio/mpeg", b"\x00" * 16, url)
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    client.generate_speech(text="hello")
+
+    assert client.session.verify is False
+    assert captured["verify"] is None
+
+
+def test_speech_stream_passes_audio_through_and_closes(monkeypatch):
+    client = TTSClient()
+    sent = []
+
+    def fake_post(self, url, data=None, headers=None, timeout=None, verify=None, **kwargs):
+        sent.append((data, headers))
+        response = _DummyResponse("audio/wav", b"RIFF" + b"\x01" * 200_000, url)
+        sent.append(response)
+        return response
+
+    monkeypatch.setattr(client.session, "post", types.MethodType(fake_post, client.session))
+
+    with client.generate_speech_stream("hello", response_format="flac") as (headers, chunks):
+        assert headers["content-type"] == "audio/wav"
+        received = list(chunks)
+
+    (data, _), response = sent
+    assert data["response_format"] == "wav"
+    assert len(received) > 1 and b"".join(received) == response.content
+    assert response.closed
+
+
+def test_shared_session_is_reused_and_survives_close(monkeypatch):
+    monkeypatch.setattr(TTSClient, "_shared_sessions", {})
+
+    first = TTSClient(shared_session=True, dns_cache_ttl=300)
+    second = TTSClient(shared_session=True, dns_cache_ttl=300)
+    private = TTSClient(dns_cache_ttl=300)
+
+    assert first.session is second.session
+    assert list(TTSClient._shared_sessions.values()) == [first.session]
+    assert private.session is not first.session
+
+    assert first._dns_cache is second._dns_cache is not None
+
+    closed = []
+    monkeypatch.setattr(first.session, "close", lambda: closed.append(True))
+    first.close()
+    assert closed == []
+
+
+def test_shared_session_is_not_reused_across_different_settings(monkeypatch):
+    monkeypatch.setattr(TTSClient, "_shared_sessions", {})
+
+    insecure = TTSClient(verify_ssl=False, shared_session=True)
+    secure = TTSClient(verify_ssl=True, shared_session=True)
+
+    assert insecure.session is not secure.session
+    assert insecure.session.verify is False
+    assert secure.session.verify is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, expected_calls", [(422, 1), (503, 3)])
+async def test_async_retries_only_transient_statuses(monkeypatch, status, expected_calls):
+    from ttsfm.exceptions import TTSException
+
+    client = AsyncTTSClient(max_retries=2)
+    calls = []
+
+    class _FakeAsyncResponse:
+        def __init__(self):
+            self.status = status
+            self.headers = {"content-type": "application/json"}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def read(self):
+            return b'{"error": {"message": "nope"}}'
+
+    class _FakeSession:
+        closed = False
+
+        def post(self, url, data=None):
+            calls.append(url)
+            return _FakeAsyncResponse()
+
+    async def no_sleep(delay):
+        return None
+
+    client._session = _FakeSession()
+    monkeypatch.setattr("ttsfm.async_client.asyncio.sleep", no_sleep)
+
+    with pytest.raises(TTSException, match="nope"):
+        await client.generate_speech(text="hello")
+
+    assert len(calls) == expected_calls
+
+
+@pytest.mark.parametrize("pool_block", [False, True])
+def test_pool_block_is_passed_to_the_adapter(pool_block):
+    client = TTSClient(pool_block=pool_block)
+    adapter = client.session.get_adapter("https://www.openai.fm")
+
+    assert adapter.poolmanager.connection_pool_kw["block"] is pool_block
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [({"voice": "robot"}, "Must be one of: alloy, ash"), ({"response_format": "ogg"}, "mp3, wav")],
+)
+def test_invalid_voice_or_format_lists_plain_options(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        TTSRequest(input="hello", **kwargs)
+
+
+def test_save_to_file_writes_audio_with_format_extension(tmp_path):
+    response = _mk_response(b"ID3" + b"\x00" * 100_000)
+
+    path = response.save_to_file(str(tmp_path / "nested" / "speech.wav"))
+
+    assert path.endswith("speech.mp3")
+    with open(path, "rb") as handle:
+        assert handle.read() == response.audio_data
@@ -54,6 +54,16 @@ def test_header_generation_deterministic_upgrade_flag(monkeypatch):
     assert headers_first["Accept-Language"] != headers_second["Accept-Language"]
 
 
+def test_header_generation_returns_independent_dicts():
+    headers = utils.get_realistic_headers({"X-Custom": "1"})
+    headers["Accept"] = "mutated"
+
+    fresh = utils.get_realistic_headers()
+    assert fresh["Accept"] == "application/json, audio/*"
+    assert "X-Custom" not in fresh
+    assert fresh["User-Agent"] and fresh["Accept-Language"]
+
+
 @pytest.mark.asyncio
 async def test_async_batch_propagates_original_exception(monkeypatch):
     from ttsfm.async_client import AsyncTTSClient
@@ -71,3 +81,96 @@ async def test_async_batch_propagates_original_exception(monkeypatch):
 
     with pytest.raises(NetworkException):
         await client.generate_speech_batch([request])
+
+
+def test_split_text_without_terminators_strips_surrounding_whitespace():
+    chunks = utils.split_text_by_length("  " + "word " * 30, max_length=52)
+
+    assert chunks == ["word " * 9 + "word", "word " * 9 + "word", "word " * 9 + "word"]
+
+
+def test_split_text_iter_matches_list_variant():
+    text = "One sentence. " * 40 + "word " * 300
+    expected = utils.split_text_by_length(text, max_length=80)
+    lazy = utils.split_text_by_length_iter(text, max_length=80)
+
+    assert next(lazy) == expected[0]
+    assert list(lazy) == expected[1:]
+
+
+def test_split_text_results_are_independent_copies():
+    text = "Alpha beta gamma. Delta epsilon zeta. Eta theta iota."
+
+    first = utils.split_text_by_length(text, max_length=20)
+    first.append("mutated")
+
+    assert "mutated" not in utils.split_text_by_length(text, max_length=20)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["Plain sentence.", "  padded  ", "tab\there", "a `tick`", "x &amp; y", "line\nbreak", "<i>"],
+)
+def test_sanitize_text_ascii_fast_path_matches_full_pass(text):
+    assert utils.sanitize_text(text) == utils._sanitize_text_cached(text)
+
+
+def test_sanitize_text_collapses_unicode_whitespace():
+    text = "\u3000caf\u00e9\u2003\u2003au\nlait\u00a0 "
+
+    assert utils.sanitize_text(text) == "caf\u00e9 au lait"
+
+
+def test_load_config_from_env_converts_plain_values_only(monkeypatch):
+    values = {"FLAG": "True", "COUNT": "42", "RATIO": "0.5", "VERSION": "1.2.3", "POWER": "²"}
+    for key, value in values.items():
+        monkeypatch.setenv(f"TTSFMTEST_{key}", value)
+
+    config = utils.load_config_from_env("TTSFMTEST_")
+
+    assert config == {"flag": True, "count": 42, "ratio": 0.5, "version": "1.2.3", "power": "²"}
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (0, "0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (5 * 1024**2, "5.0 MB"),
+        (3 * 1024**4, "3072.0 GB"),
+    ],
+)
+def test_format_file_size(size, expected):
+    assert utils.format_file_size(size) == expected
+
+
+def test_exponential_backoff_saturates_without_overflow():
+    assert 1.1 <= utils.exponential_backoff(0) <= 1.3
+    assert 4.4 <= utils.exponential_backoff(2) <= 5.2
+    assert utils.exponential_backoff(5000, max_delay=60.0) == 60.0
+
+
+@pytest.mark.parametrize(
+    "text", ["one two three", " one two ", "one  two\tthree\nfour", "café au lait", " "]
+)
+def test_estimate_audio_duration_counts_words_like_split(text):
+    expected = len(text.split()) / 150.0 * 60.0 * 1.1
+
+    assert utils.estimate_audio_duration(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.openai.fm", True),
+        ("http://localhost:7000/api", True),
+        ("www.openai.fm", False),
+        ("mailto:someone@example.com", False),
+        ("http://[::1", False),
+        ("", False),
+    ],
+)
+def test_validate_url(url, expected):
+    assert utils.validate_url(url) is expected
@@ -45,6 +45,18 @@ def test_voices_endpoint_returns_data(monkeypatch):
     assert payload["count"] == len(payload["voices"])
 
 
+def test_capabilities_endpoint_serializes_cached_report(monkeypatch):
+    module = load_web_app(monkeypatch, REQUIRE_API_KEY="false", TTSFM_API_KEY=None)
+    client = module.app.test_client()
+
+    first = client.get("/api/capabilities").get_json()
+    second = client.get("/api/capabilities").get_json()
+
+    assert first == second
+    assert first["features"]["basic_formats"] is True
+    assert first["supported_formats"][:2] == ["mp3", "wav"]
+
+
 def test_combine_audio_chunks_uses_format_hint(monkeypatch):
     load_web_app(monkeypatch, REQUIRE_API_KEY="false", TTSFM_API_KEY=None)
 
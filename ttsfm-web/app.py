@@ -548,7 +548,15 @@ def health_check():
 def get_system_capabilities():
     """Get system capabilities and available features."""
     caps = get_capabilities()
-    return jsonify(caps.get_capabilities())
+    report = caps.get_capabilities()
+    # The cached report is read-only; hand jsonify plain containers
+    return jsonify(
+        {
+            **report,
+            "features": dict(report["features"]),
+            "supported_formats": list(report["supported_formats"]),
+        }
+    )
 
 
 @app.route("/api/websocket/status", methods=["GET"])
@@ -37,7 +37,7 @@ Example:
 from typing import Optional
 
 from .async_client import AsyncTTSClient
-from .audio import combine_audio_chunks, combine_responses
+from .audio import combine_audio_chunks, combine_responses, concatenate_responses
 from .client import TTSClient
 from .exceptions import (
     APIException,
@@ -197,6 +197,7 @@ __all__ = [
     "split_text_by_length",
     "combine_audio_chunks",
     "combine_responses",
+    "concatenate_responses",
     # Package metadata
     "__version__",
     "__author__",
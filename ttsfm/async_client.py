@@ -6,33 +6,38 @@ text-to-speech generation with OpenAI-compatible API.
 """
 
 import asyncio
-import json
+import functools
+import itertools
 import logging
+import os
 import uuid
-from typing import Dict, List, Optional, Union
+import warnings
+from typing import Dict, List, Optional, Union, cast
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
-from .audio import combine_responses
+from .audio import build_tts_response, combine_responses, needs_audio_processing
 from .exceptions import (
-    APIException,
+    MAX_ERROR_MESSAGE_BYTES,
     NetworkException,
     TTSException,
     ValidationException,
     create_exception_from_response,
+    parse_error_body,
 )
 from .models import (
+    DEFAULT_PROMPT,
     AudioFormat,
     TTSRequest,
     TTSResponse,
     Voice,
+    get_content_type,
 )
 from .utils import (
+    RETRY_STATUS_CODES,
     build_url,
-    estimate_audio_duration,
     exponential_backoff,
-    format_file_size,
     get_realistic_headers,
     sanitize_text,
     split_text_by_length,
@@ -41,6 +46,9 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds an idle pooled connection is kept open for reuse
+_KEEPALIVE_TIMEOUT = 75.0
+
 
 class AsyncTTSClient:
     """
@@ -68,6 +76,10 @@ class AsyncTTSClient:
         max_concurrent: int = 10,
         default_headers: Optional[Dict[str, str]] = None,
         use_default_prompt: bool = False,
+        default_prompt: Optional[str] = None,
+        include_response_headers: bool = False,
+        legacy_metadata: bool = False,
+        estimate_duration: bool = True,
         **kwargs,
     ):
         """
@@ -80,6 +92,15 @@ class AsyncTTSClient:
             max_retries: Maximum retry attempts
             verify_ssl: Whether to verify SSL certificates
             max_concurrent: Maximum concurrent requests
+            default_prompt: Prompt to send when a request has no instructions;
+                setting it implies ``use_default_prompt``
+            include_response_headers: Whether to copy a small set of response
+                headers (content type/length, request id) into response metadata
+            legacy_metadata: Deprecated. Also fill the metadata keys that are no
+                longer set by default: ``original_text`` (a 100-character preview
+                of the input) and ``response_headers`` with every header
+            estimate_duration: Whether to fill ``TTSResponse.duration`` with a
+                text-based estimate; disable to skip the word count per response
             **kwargs: Additional configuration options
         """
         self.base_url = base_url.rstrip("/")
@@ -89,17 +110,36 @@ class AsyncTTSClient:
         self.verify_ssl = verify_ssl
         self.max_concurrent = max_concurrent
         self.use_default_prompt = use_default_prompt
+        self._default_prompt: Optional[str] = default_prompt or (
+            DEFAULT_PROMPT if use_default_prompt else None
+        )
+        self.include_response_headers = include_response_headers
+        self.legacy_metadata = legacy_metadata
+        if legacy_metadata:
+            warnings.warn(
+                "legacy_metadata is deprecated and will be removed in a future release; "
+                "use metadata['text_length'] and include_response_headers instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        self.estimate_duration = estimate_duration
         self.default_headers = default_headers or {}
 
         # Validate base URL
         if not validate_url(self.base_url):
             raise ValidationException(f"Invalid base URL: {self.base_url}")
 
+        self._generate_url = build_url(self.base_url, "api/generate")
+        # Generation ids only need to be unique: one random prefix per client
+        # plus a counter avoids an urandom call for every request
+        self._generation_prefix = int.from_bytes(os.urandom(8), "big")
+        self._generation_counter = itertools.count()
+
         # Session will be created when needed
         self._session: Optional[ClientSession] = None
         self._semaphore = asyncio.Semaphore(max_concurrent)
 
-        logger.info(f"Initialized async TTS client with base URL: {self.base_url}")
+        logger.info("Initialized async TTS client with base URL: %s", self.base_url)
 
     async def __aenter__(self):  # type: ignore[no-untyped-def]
         """Async context manager entry."""
@@ -122,8 +162,12 @@ class AsyncTTSClient:
             timeout = ClientTimeout(total=self.timeout)
 
             # Create session
+            # Keep idle connections longer than aiohttp's 15s default so
+            # bursts of requests a minute apart skip the TLS handshake
             connector = aiohttp.TCPConnector(
-                verify_ssl=self.verify_ssl, limit=self.max_concurrent * 2
+                ssl=bool(self.verify_ssl),
+                limit=self.max_concurrent * 2,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
             )
 
             self._session = ClientSession(headers=headers, timeout=timeout, connector=connector)
@@ -138,15 +182,7 @@ class AsyncTTSClient:
         Returns:
             str: The MIME type for the format
         """
-        format_to_mime = {
-            AudioFormat.MP3: "audio/mpeg",
-            AudioFormat.WAV: "audio/wav",
-            AudioFormat.OPUS: "audio/opus",
-            AudioFormat.AAC: "audio/aac",
-            AudioFormat.FLAC: "audio/flac",
-            AudioFormat.PCM: "audio/pcm",
-        }
-        return format_to_mime.get(audio_format, "audio/mpeg")
+        return get_content_type(audio_format)
 
     async def generate_speech(  # type: ignore[no-untyped-def]
         self,
@@ -156,6 +192,7 @@ class AsyncTTSClient:
         instructions: Optional[str] = None,
         max_length: int = 1000,
         validate_length: bool = True,
+        skip_sanitize: bool = False,
         **kwargs,
     ) -> TTSResponse:
         """
@@ -168,6 +205,8 @@ class AsyncTTSClient:
             instructions: Optional instructions for voice modulation
             max_length: Maximum allowed text length in characters (default: 1000)
             validate_length: Whether to validate text length (default: True)
+            skip_sanitize: Send ``text`` as-is, for input that is already clean
+                (default: False)
             **kwargs: Additional parameters
 
         Returns:
@@ -179,7 +218,7 @@ class AsyncTTSClient:
         """
         # Create and validate request
         request = TTSRequest(
-            input=sanitize_text(text),
+            input=text if skip_sanitize else sanitize_text(text),
             voice=voice,
             response_format=response_format,
             instructions=instructions,
@@ -234,19 +273,19 @@ class AsyncTTSClient:
 
         send_format = self._resolve_long_text_format(response_format, auto_combine)
 
-        # Create requests for all chunks
-        requests = []
-        for chunk in chunks:
-            request = TTSRequest(
-                input=chunk,
-                voice=voice,
-                response_format=send_format,
-                instructions=instructions,
-                max_length=max_length,
-                validate_length=False,  # We already split the text
-                **kwargs,
-            )
-            requests.append(request)
+        # Validate voice, format and options once, then stamp out the other
+        # chunks from that template (length validation is off: already split)
+        template = TTSRequest(
+            input=chunks[0],
+            voice=voice,
+            response_format=send_format,
+            instructions=instructions,
+            max_length=max_length,
+            validate_length=False,
+            **kwargs,
+        )
+        requests = [template]
+        requests.extend(template.with_input(chunk) for chunk in chunks[1:])
 
         # Process all chunks concurrently
         responses = await self.generate_speech_batch(requests=requests)
@@ -376,6 +415,15 @@ class AsyncTTSClient:
         """
         return await self._make_request(request)
 
+    def _next_generation_id(self) -> str:
+        """Return a generation id unique to this client and request.
+
+        The id keeps the UUID4 shape openai.fm has always been sent: the client
+        prefix fills the high 64 bits and the request counter the low ones.
+        """
+        value = (self._generation_prefix << 64) | next(self._generation_counter)
+        return str(uuid.UUID(int=value, version=4))
+
     async def _make_request(self, request: TTSRequest) -> TTSResponse:
         """
         Make the actual HTTP request to the TTS service.
@@ -392,47 +440,44 @@ class AsyncTTSClient:
         await self._ensure_session()
 
         async with self._semaphore:  # Limit concurrent requests
-            url = build_url(self.base_url, "api/generate")
+            url = self._generate_url
 
             # Prepare form data for openai.fm API
-            voice_value = (
-                request.voice.value if isinstance(request.voice, Voice) else str(request.voice)
-            )
-            format_value = (
-                request.response_format.value
-                if isinstance(request.response_format, AudioFormat)
-                else str(request.response_format)
-            )
+            voice_value = cast(Voice, request.voice).value
+
+            # TTSRequest has already normalised the format to an AudioFormat
+            requested_format = cast(AudioFormat, request.response_format)
+
+            # Determine base format to request from openai.fm
+            # We request MP3 or WAV, then convert to other formats using ffmpeg
+            if requested_format == AudioFormat.MP3:
+                base_format = AudioFormat.MP3
+            else:
+                # For all other formats (WAV, OPUS, AAC, FLAC, PCM), request WAV
+                base_format = AudioFormat.WAV
 
             form_data = {
                 "input": request.input,
                 "voice": voice_value,
-                "generation": str(uuid.uuid4()),
-                "response_format": format_value,
+                "generation": self._next_generation_id(),
+                "response_format": base_format.value,
             }
 
-            # Add prompt/instructions if provided
-            if request.instructions:
-                form_data["prompt"] = request.instructions
-            elif self.use_default_prompt:
-                # Default prompt for better quality
-                form_data["prompt"] = (
-                    "Affect/personality: Natural and clear\n\n"
-                    "Tone: Friendly and professional, creating a pleasant "
-                    "listening experience.\n\n"
-                    "Pronunciation: Clear, articulate, and steady, ensuring "
-                    "each word is easily understood while maintaining a "
-                    "natural, conversational flow.\n\n"
-                    "Pause: Brief, purposeful pauses between sentences to "
-                    "allow time for the listener to process the information.\n\n"
-                    "Emotion: Warm and engaging, conveying the intended "
-                    "message effectively."
-                )
+            # Add prompt/instructions if provided, falling back to the default prompt
+            prompt = request.instructions or self._default_prompt
+            if prompt:
+                form_data["prompt"] = prompt
 
-            logger.info(
-                "Generating speech for text: '%s...' with voice: %s",
-                request.input[:50],
-                request.voice,
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Generating speech for text: '%s...' with voice: %s",
+                    request.input[:50],
+                    request.voice,
+                )
+            logger.debug(
+                "Requesting %s from openai.fm (target format: %s)",
+                base_format.value,
+                requested_format.value,
             )
 
             # Make request with retries
@@ -441,45 +486,24 @@ class AsyncTTSClient:
                     # Add random delay for rate limiting (except first attempt)
                     if attempt > 0:
                         delay = exponential_backoff(attempt - 1)
-                        logger.info(f"Retrying request after {delay:.2f}s (attempt {attempt + 1})")
+                        logger.info("Retrying request after %.2fs (attempt %d)", delay, attempt + 1)
                         await asyncio.sleep(delay)
 
-                    # Use form data as required by openai.fm
-                    payload = dict(form_data)
-                    # Normalize requested format
-                    requested_format = request.response_format
-                    if isinstance(requested_format, str):
-                        try:
-                            requested_format = AudioFormat(requested_format.lower())
-                        except ValueError:
-                            requested_format = AudioFormat.MP3
-
-                    # Determine base format to request from openai.fm
-                    # We request MP3 or WAV, then convert to other formats using ffmpeg
-                    if requested_format == AudioFormat.MP3:
-                        base_format = AudioFormat.MP3
-                    else:
-                        # For all other formats (WAV, OPUS, AAC, FLAC, PCM), request WAV
-                        base_format = AudioFormat.WAV
-
-                    payload["response_format"] = base_format.value
-                    logger.debug(
-                        f"Requesting {base_format.value} from openai.fm (target format: {requested_format.value})"
-                    )
                     if self._session is None:
                         await self._ensure_session()
                     if self._session is not None:
-                        async with self._session.post(url, data=payload) as response:
-                            # Handle different response types
-                            if response.status == 200:
+                        async with self._session.post(url, data=form_data) as response:
+                            if 200 <= response.status < 300:
                                 return await self._process_openai_fm_response(response, request)
+
+                            # Only JSON bodies are read in full; error pages
+                            # just need a preview
+                            content_type = response.headers.get("content-type")
+                            if content_type and "json" in content_type.lower():
+                                body = await response.read()
                             else:
-                                # Try to parse error response
-                                try:
-                                    error_data = await response.json()
-                                except (json.JSONDecodeError, ValueError):
-                                    text = await response.text()
-                                    error_data = {"error": {"message": text or "Unknown error"}}
+                                body = await response.content.read(MAX_ERROR_MESSAGE_BYTES)
+                            error_data = parse_error_body(content_type, body)
 
                             # Create appropriate exception
                             exception = create_exception_from_response(
@@ -488,16 +512,16 @@ class AsyncTTSClient:
                                 f"TTS request failed with status {response.status}",
                             )
 
-                            # Don't retry for certain errors
-                            if response.status in [400, 401, 403, 404]:
-                                raise exception
-
-                            # For retryable errors, continue to next attempt
-                            if attempt == self.max_retries:
+                            # Only rate limiting and transient upstream errors are
+                            # retried, matching the sync client's retry policy
+                            if (
+                                response.status not in RETRY_STATUS_CODES
+                                or attempt == self.max_retries
+                            ):
                                 raise exception
 
                             logger.warning(
-                                f"Request failed with status {response.status}, retrying..."
+                                "Request failed with status %s, retrying...", response.status
                             )
                             continue
 
@@ -533,179 +557,22 @@ class AsyncTTSClient:
         Returns:
             TTSResponse: Processed response object
         """
-        # Get content type from response headers
-        content_type = response.headers.get("content-type", "audio/mpeg")
-
-        # Get audio data
-        audio_data = await response.read()
-
-        if not audio_data:
-            raise APIException("Received empty audio data from openai.fm")
-
-        # Determine format from content type
-        if "audio/mpeg" in content_type or "audio/mp3" in content_type:
-            actual_format = AudioFormat.MP3
-        elif "audio/wav" in content_type:
-            actual_format = AudioFormat.WAV
-        elif "audio/opus" in content_type:
-            actual_format = AudioFormat.OPUS
-        elif "audio/aac" in content_type:
-            actual_format = AudioFormat.AAC
-        elif "audio/flac" in content_type:
-            actual_format = AudioFormat.FLAC
-        else:
-            # Default to MP3 for openai.fm
-            actual_format = AudioFormat.MP3
-
-        # Estimate duration based on text length
-        estimated_duration = estimate_audio_duration(request.input)
-
-        # Normalize requested format
-        requested_format = request.response_format
-        if isinstance(requested_format, str):
-            try:
-                requested_format = AudioFormat(requested_format.lower())
-            except ValueError:
-                requested_format = AudioFormat.MP3  # Default fallback
-
-        # Apply speed adjustment if requested (requires ffmpeg)
-        speed_applied = False
-        if request.speed is not None and request.speed != 1.0:
-            try:
-                from .audio_processing import adjust_audio_speed
-
-                logger.info(f"Applying speed adjustment: {request.speed}x")
-                # Run CPU-intensive ffmpeg processing in thread pool
-                loop = asyncio.get_event_loop()
-                audio_data = await loop.run_in_executor(
-                    None,
-                    adjust_audio_speed,
-                    audio_data,
-                    request.speed,
-                    actual_format.value,
-                    actual_format.value,
-                )
-                speed_applied = True
-                # Adjust estimated duration based on speed
-                if estimated_duration:
-                    estimated_duration = estimated_duration / request.speed
-            except RuntimeError as e:
-                logger.warning(f"Speed adjustment failed: {e}")
-                # Continue without speed adjustment
-            except Exception as e:
-                logger.error(f"Unexpected error during speed adjustment: {e}")
-                # Continue without speed adjustment
-
-        # Convert format if needed (requires ffmpeg for non-MP3/WAV formats)
-        if actual_format != requested_format:
-            # Check if conversion is needed
-            if requested_format in [
-                AudioFormat.OPUS,
-                AudioFormat.AAC,
-                AudioFormat.FLAC,
-                AudioFormat.PCM,
-            ]:
-                try:
-                    from .audio_processing import convert_audio_format
-
-                    logger.info(
-                        f"Converting audio from {actual_format.value} to {requested_format.value}"
-                    )
-                    # Run CPU-intensive ffmpeg processing in thread pool
-                    loop = asyncio.get_event_loop()
-                    audio_data = await loop.run_in_executor(
-                        None,
-                        convert_audio_format,
-                        audio_data,
-                        actual_format.value,
-                        requested_format.value,
-                    )
-                    actual_format = requested_format
-                    # Update content type after conversion
-                    content_type = self._get_content_type_for_format(requested_format)
-                    logger.info(f"Successfully converted to {requested_format.value}")
-                except RuntimeError as e:
-                    logger.warning(
-                        f"Format conversion failed: {e}. Returning {actual_format.value} format."
-                    )
-                    # Continue with original format
-                except Exception as e:
-                    logger.error(f"Unexpected error during format conversion: {e}")
-                    # Continue with original format
-            elif requested_format == AudioFormat.WAV and actual_format == AudioFormat.MP3:
-                # Convert MP3 to WAV if requested
-                try:
-                    from .audio_processing import convert_audio_format
-
-                    logger.info("Converting audio from MP3 to WAV")
-                    # Run CPU-intensive ffmpeg processing in thread pool
-                    loop = asyncio.get_event_loop()
-                    audio_data = await loop.run_in_executor(
-                        None,
-                        convert_audio_format,
-                        audio_data,
-                        "mp3",
-                        "wav",
-                    )
-                    actual_format = AudioFormat.WAV
-                    # Update content type after conversion
-                    content_type = self._get_content_type_for_format(AudioFormat.WAV)
-                    logger.info("Successfully converted to WAV")
-                except RuntimeError as e:
-                    logger.warning(f"Format conversion failed: {e}. Returning MP3 format.")
-                except Exception as e:
-                    logger.error(f"Unexpected error during format conversion: {e}")
-
-        # Get voice value for logging
-        voice_value = request.voice.value if hasattr(request.voice, "value") else str(request.voice)
-
-        # Create response object
-        metadata = {
-            "response_headers": dict(response.headers),
-            "status_code": response.status,
-            "url": str(response.url),
-            "service": "openai.fm",
-            "voice": voice_value,
-            "original_text": (
-                request.input[:100] + "..." if len(request.input) > 100 else request.input
-            ),
-            "requested_format": (
-                requested_format.value
-                if isinstance(requested_format, AudioFormat)
-                else str(requested_format)
-            ),
-            "actual_format": (
-                actual_format.value
-                if isinstance(actual_format, AudioFormat)
-                else str(actual_format)
-            ),
-        }
-
-        # Add speed metadata if speed was requested
-        if request.speed is not None:
-            metadata["requested_speed"] = request.speed
-            metadata["speed_applied"] = speed_applied
-
-        tts_response = TTSResponse(
-            audio_data=audio_data,
-            content_type=content_type,
-            format=actual_format,
-            size=len(audio_data),
-            duration=estimated_duration,
-            metadata=metadata,
-        )
-
-        actual_format_str = (
-            actual_format.value if isinstance(actual_format, AudioFormat) else str(actual_format)
-        )
-        logger.info(
-            "Successfully generated %s of %s audio from openai.fm using voice %s",
-            format_file_size(len(audio_data)),
-            actual_format_str.upper(),
-            voice_value,
+        build = functools.partial(
+            build_tts_response,
+            await response.read(),
+            request,
+            response.headers,
+            response.status,
+            str(response.url),
+            estimate_duration=self.estimate_duration,
+            include_response_headers=self.include_response_headers,
+            legacy_metadata=self.legacy_metadata,
         )
-
-        return tts_response
+        content_type = response.headers.get("content-type", "audio/mpeg")
+        if needs_audio_processing(request, content_type):
+            # ffmpeg is CPU bound; keep it off the event loop
+            return await asyncio.get_event_loop().run_in_executor(None, build)
+        return build()
 
     async def close(self) -> None:
         """Close the HTTP session."""
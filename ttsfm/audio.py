@@ -5,10 +5,19 @@ from __future__ import annotations
 import io
 import logging
 import shutil
-from typing import Iterable, List, Sequence
-
-from .exceptions import AudioProcessingException
-from .models import TTSResponse
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, cast
+
+from .audio_processing import adjust_audio_speed, convert_audio_format
+from .exceptions import APIException, AudioProcessingException
+from .models import (
+    AudioFormat,
+    TTSRequest,
+    TTSResponse,
+    Voice,
+    get_content_type,
+    get_format_from_content_type,
+)
+from .utils import estimate_audio_duration, format_file_size
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +33,12 @@ FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
 
 SUPPORTED_EXPORT_FORMATS = {"mp3", "wav", "aac", "flac", "opus", "pcm"}
 
+# Response headers copied into metadata when include_response_headers is set
+_METADATA_HEADERS = ("content-type", "content-length", "x-request-id")
+
+# Formats openai.fm never returns directly; they are converted with ffmpeg
+_CONVERTED_FORMATS = (AudioFormat.OPUS, AudioFormat.AAC, AudioFormat.FLAC, AudioFormat.PCM)
+
 
 def combine_audio_chunks(audio_chunks: Iterable[bytes], format_type: str = "mp3") -> bytes:
     """Combine multiple audio chunks into a single audio file.
@@ -98,11 +113,10 @@ def _simple_wav_concatenation(wav_chunks: List[bytes]) -> bytes:
             return b"".join(wav_chunks)
 
         header = bytearray(first_wav[:44])
-        audio_data = first_wav[44:]
-
-        for wav_chunk in wav_chunks[1:]:
-            if len(wav_chunk) > 44:
-                audio_data += wav_chunk[44:]
+        # One join sizes the payload once instead of re-copying it per chunk
+        audio_data = b"".join(
+            [first_wav[44:]] + [chunk[44:] for chunk in wav_chunks[1:] if len(chunk) > 44]
+        )
 
         total_size = len(header) + len(audio_data) - 8
         header[4:8] = total_size.to_bytes(4, byteorder="little")
@@ -110,12 +124,62 @@ def _simple_wav_concatenation(wav_chunks: List[bytes]) -> bytes:
         data_size = len(audio_data)
         header[40:44] = data_size.to_bytes(4, byteorder="little")
 
-        return bytes(header) + audio_data
+        return b"".join((header, audio_data))
     except Exception as exc:
         logger.error("Error in simple WAV concatenation: %s", exc)
         return b"".join(wav_chunks)
 
 
+def concatenate_responses(responses: Sequence["TTSResponse"]) -> "TTSResponse":
+    """Join ``TTSResponse`` objects byte-for-byte into a single response.
+
+    Unlike :func:`combine_responses` nothing is decoded or re-encoded, so no
+    pydub/ffmpeg is needed. WAV chunks are merged under one rewritten header;
+    every other format is appended as-is, which plays back correctly for
+    frame-based streams such as MP3, AAC (ADTS) and PCM.
+
+    Args:
+        responses: Chunk responses in playback order, all in the same format
+
+    Returns:
+        A single response holding the joined audio
+
+    Raises:
+        ValueError: If no responses are given or their formats differ
+    """
+
+    responses = list(responses)
+    if not responses:
+        raise ValueError("No responses provided for concatenation")
+
+    first = responses[0]
+    audio_format = first.format
+    if any(resp.format != audio_format for resp in responses):
+        raise ValueError("Cannot concatenate responses with different audio formats")
+
+    chunks = [resp.audio_data for resp in responses]
+    if audio_format.value == "wav":
+        audio_bytes = _simple_wav_concatenation(chunks)
+    else:
+        audio_bytes = b"".join(chunks)
+
+    total_duration = None
+    if any(resp.duration is not None for resp in responses):
+        total_duration = sum(filter(None, (resp.duration for resp in responses)))
+
+    metadata = dict(first.metadata or {})
+    metadata.update({"chunks_combined": len(responses), "auto_combined": False})
+
+    return TTSResponse(
+        audio_data=audio_bytes,
+        content_type=first.content_type,
+        format=audio_format,
+        size=len(audio_bytes),
+        duration=total_duration,
+        metadata=metadata,
+    )
+
+
 def combine_responses(responses: Sequence["TTSResponse"]) -> "TTSResponse":
     """Combine multiple ``TTSResponse`` objects into a single response."""
 
@@ -148,3 +212,176 @@ def combine_responses(responses: Sequence["TTSResponse"]) -> "TTSResponse":
         duration=total_duration if total_duration is not None else first.duration,
         metadata=metadata,
     )
+
+
+def needs_audio_processing(request: TTSRequest, content_type: str) -> bool:
+    """Whether ``build_tts_response`` may run ffmpeg for this request and response."""
+    if request.speed is not None and request.speed != 1.0:
+        return True
+    return get_format_from_content_type(content_type) != request.response_format
+
+
+def build_tts_response(
+    audio_data: bytes,
+    request: TTSRequest,
+    headers: Mapping[str, str],
+    status_code: int,
+    url: str,
+    estimate_duration: bool = True,
+    include_response_headers: bool = False,
+    legacy_metadata: bool = False,
+) -> TTSResponse:
+    """
+    Turn a successful openai.fm response body into a ``TTSResponse``.
+
+    Applies the requested speed and converts to the requested format when
+    ffmpeg is available; either step falls back to the audio as received.
+
+    Args:
+        audio_data: Response body
+        request: Original TTS request
+        headers: Response headers
+        status_code: HTTP status of the response
+        url: Final URL of the response
+        estimate_duration: Whether to estimate the duration from the text
+        include_response_headers: Whether to copy a small set of response
+            headers into metadata
+        legacy_metadata: Whether to also fill the deprecated metadata keys
+
+    Returns:
+        TTSResponse: Processed response object
+
+    Raises:
+        APIException: If the response body is empty
+    """
+    if not audio_data:
+        raise APIException("Received empty audio data from openai.fm")
+
+    # Determine format from content type (openai.fm defaults to MP3)
+    content_type = headers.get("content-type", "audio/mpeg")
+    actual_format = get_format_from_content_type(content_type)
+
+    # Estimate duration based on text length (rough approximation)
+    estimated_duration: Optional[float] = (
+        estimate_audio_duration(request.input) if estimate_duration else None
+    )
+
+    # TTSRequest has already normalised voice and format to their enums
+    requested_format = cast(AudioFormat, request.response_format)
+
+    # Apply speed adjustment if requested (requires ffmpeg)
+    speed_applied = False
+    if request.speed is not None and request.speed != 1.0:
+        try:
+            logger.info("Applying speed adjustment: %sx", request.speed)
+            audio_data = adjust_audio_speed(
+                audio_data,
+                speed=request.speed,
+                input_format=actual_format.value,
+                output_format=actual_format.value,
+            )
+            speed_applied = True
+            # Adjust estimated duration based on speed
+            if estimated_duration:
+                estimated_duration = estimated_duration / request.speed
+        except RuntimeError as e:
+            logger.warning("Speed adjustment failed: %s", e)
+            # Continue without speed adjustment
+        except Exception as e:
+            logger.error("Unexpected error during speed adjustment: %s", e)
+            # Continue without speed adjustment
+
+    # Convert format if needed (requires ffmpeg for non-MP3/WAV formats)
+    if actual_format != requested_format:
+        # Check if conversion is needed
+        if requested_format in _CONVERTED_FORMATS:
+            try:
+                logger.info(
+                    "Converting audio from %s to %s",
+                    actual_format.value,
+                    requested_format.value,
+                )
+                audio_data = convert_audio_format(
+                    audio_data,
+                    input_format=actual_format.value,
+                    output_format=requested_format.value,
+                )
+                actual_format = requested_format
+                # Update content type after conversion
+                content_type = get_content_type(requested_format)
+                logger.info("Successfully converted to %s", requested_format.value)
+            except RuntimeError as e:
+                logger.warning(
+                    "Format conversion failed: %s. Returning %s format.",
+                    e,
+                    actual_format.value,
+                )
+                # Continue with original format
+            except Exception as e:
+                logger.error("Unexpected error during format conversion: %s", e)
+                # Continue with original format
+        elif requested_format == AudioFormat.WAV and actual_format == AudioFormat.MP3:
+            # Convert MP3 to WAV if requested
+            try:
+                logger.info("Converting audio from MP3 to WAV")
+                audio_data = convert_audio_format(
+                    audio_data,
+                    input_format="mp3",
+                    output_format="wav",
+                )
+                actual_format = AudioFormat.WAV
+                # Update content type after conversion
+                content_type = get_content_type(AudioFormat.WAV)
+                logger.info("Successfully converted to WAV")
+            except RuntimeError as e:
+                logger.warning("Format conversion failed: %s. Returning MP3 format.", e)
+            except Exception as e:
+                logger.error("Unexpected error during format conversion: %s", e)
+
+    # Get voice value for logging
+    voice_value = cast(Voice, request.voice).value
+
+    # Create response object
+    metadata: Dict[str, Any] = {
+        "status_code": status_code,
+        "url": url,
+        "service": "openai.fm",
+        "voice": voice_value,
+        "text_length": len(request.input),
+        "requested_format": requested_format.value,
+        "actual_format": actual_format.value,
+    }
+
+    if legacy_metadata:
+        metadata["original_text"] = (
+            request.input[:100] + "..." if len(request.input) > 100 else request.input
+        )
+        metadata["response_headers"] = dict(headers)
+    elif include_response_headers:
+        metadata["response_headers"] = {
+            name: headers[name] for name in _METADATA_HEADERS if name in headers
+        }
+
+    # Add speed metadata if speed was requested
+    if request.speed is not None:
+        metadata["requested_speed"] = request.speed
+        metadata["speed_applied"] = speed_applied
+
+    tts_response = TTSResponse(
+        audio_data=audio_data,
+        content_type=content_type,
+        format=actual_format,
+        size=len(audio_data),
+        duration=estimated_duration,
+        metadata=metadata,
+    )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Successfully generated %s of %s audio from openai.fm using voice %s",
+            format_file_size(len(audio_data)),
+            actual_format.value.upper(),
+            voice_value,
+        )
+
+    return tts_response
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
@@ -42,8 +43,6 @@ def adjust_audio_speed(
         return audio_data
 
     # Check ffmpeg availability
-    import shutil
-
     if not shutil.which("ffmpeg"):
         raise RuntimeError(
             "Speed adjustment requires ffmpeg. "
@@ -155,8 +154,6 @@ def convert_audio_format(
         RuntimeError: If ffmpeg is not available or conversion fails
     """
     # Check ffmpeg availability
-    import shutil
-
     if not shutil.which("ffmpeg"):
         raise RuntimeError(
             "Format conversion requires ffmpeg. "
@@ -0,0 +1,291 @@
+"""
+Response cache for repeated TTS requests.
+
+Identical requests (same text, voice, format, instructions and speed) produce
+the same audio, so a client can answer repeats from memory, or from a cache
+directory shared across processes, instead of paying for another round trip
+to openai.fm.
+"""
+
+import dataclasses
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .models import AudioFormat, TTSResponse
+from .utils import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_CACHE_DIR_MAX_BYTES = 256 * 1024 * 1024
+
+# Cache directory entries are named after the hex digest of their key
+_ENTRY_NAME = re.compile(r"[0-9a-f]{32}\.(?:bin|json)")
+
+
+def make_cache_key(
+    base_url: str,
+    text: str,
+    voice: str,
+    response_format: str,
+    instructions: Optional[str] = None,
+    speed: Optional[float] = None,
+) -> bytes:
+    """
+    Build a compact cache key from the fields that determine the audio output.
+
+    Args:
+        base_url: Service the request is sent to
+        text: Input text
+        voice: Voice identifier
+        response_format: Requested audio format
+        instructions: Prompt sent with the request, if any
+        speed: Requested playback speed, if any
+
+    Returns:
+        bytes: 16-byte digest identifying the request
+    """
+    payload = f"{base_url}|{voice}|{response_format}|{instructions or ''}|{speed or 1.0}|{text}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def _clone(response: TTSResponse) -> TTSResponse:
+    """Return a shallow copy whose metadata callers can mutate independently."""
+    metadata = dict(response.metadata) if response.metadata is not None else None
+    return dataclasses.replace(response, metadata=metadata)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never observe a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _unlink_quietly(*paths: Path) -> None:
+    """Delete ``paths``, ignoring files that are already gone or locked."""
+    for path in paths:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of TTS responses bounded by entry count and total bytes.
+
+    With a ``directory`` the cache is also written through to disk as
+    ``<key>.bin`` (audio) plus a ``<key>.json`` sidecar, so separate processes
+    sharing the directory reuse each other's results. Only files named after
+    a cache key are ever read or deleted there.
+
+    Attributes:
+        max_entries: Maximum number of responses cached in memory
+        max_bytes: Maximum total size of audio data cached in memory
+        directory: Optional directory persisting responses across processes
+        ttl: Optional lifetime of an entry in seconds
+        max_disk_bytes: Maximum total size of the entries in ``directory``;
+            the least recently written entries are deleted beyond it
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        directory: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = None,
+        max_disk_bytes: int = DEFAULT_CACHE_DIR_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = Path(directory).expanduser() if directory is not None else None
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[bytes, Tuple[float, TTSResponse]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # Bytes written to the directory since it was last measured; other
+        # processes may write too, so pruning always rescans it
+        self._disk_size = 0
+        self._disk_lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._disk_lock:
+                self._prune_disk()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total bytes of audio currently cached in memory."""
+        return self._size
+
+    def get(self, key: bytes) -> Optional[TTSResponse]:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Memory is checked first, then the cache directory (if any); disk hits
+        are promoted into memory.
+
+        Returns:
+            Optional[TTSResponse]: A copy of the cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, response = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    return _clone(response)
+                self._remove(key)
+
+        if self.directory is None:
+            return None
+
+        loaded = self._load(key)
+        if loaded is None:
+            return None
+        written_at, response = loaded
+        # Age the promoted entry from when it was written, not when it was read
+        self._remember(key, response, time.monotonic() - (time.time() - written_at))
+        return _clone(response)
+
+    def put(self, key: bytes, response: TTSResponse) -> None:
+        """Store a response, evicting least recently used entries to stay in budget."""
+        self._remember(key, response)
+        if self.directory is None:
+            return
+        try:
+            written = self._store(key, response)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to write response cache entry: %s", e)
+            return
+        with self._disk_lock:
+            self._disk_size += written
+            if self._disk_size > self.max_disk_bytes:
+                self._prune_disk()
+
+    def clear(self) -> None:
+        """Remove every cached response, including files in the cache directory."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.directory is not None:
+            with self._disk_lock:
+                _unlink_quietly(
+                    *(path for path in self.directory.iterdir() if _ENTRY_NAME.fullmatch(path.name))
+                )
+                self._disk_size = 0
+
+    def _remember(
+        self, key: bytes, response: TTSResponse, stored_at: Optional[float] = None
+    ) -> None:
+        size = len(response.audio_data)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            if stored_at is None:
+                stored_at = time.monotonic()
+            self._entries[key] = (stored_at, _clone(response))
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted.audio_data)
+
+    def _remove(self, key: bytes) -> None:
+        # Caller holds the lock
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1].audio_data)
+
+    def _paths(self, key: bytes) -> Tuple[Path, Path]:
+        assert self.directory is not None
+        name = key.hex()
+        return self.directory / f"{name}.bin", self.directory / f"{name}.json"
+
+    def _load(self, key: bytes) -> Optional[Tuple[float, TTSResponse]]:
+        """Read an entry from the directory, with the time it was written."""
+        audio_path, meta_path = self._paths(key)
+        try:
+            written_at = audio_path.stat().st_mtime
+            if self.ttl is not None and time.time() - written_at >= self.ttl:
+                _unlink_quietly(audio_path, meta_path)
+                return None
+            info = json_loads(meta_path.read_bytes())
+            audio_data = audio_path.read_bytes()
+            return written_at, TTSResponse(
+                audio_data=audio_data,
+                content_type=info["content_type"],
+                format=AudioFormat(info["format"]),
+                size=len(audio_data),
+                duration=info.get("duration"),
+                metadata=info.get("metadata"),
+            )
+        except (OSError, KeyError, ValueError):
+            # Missing, expired or half-written entries are plain misses
+            return None
+
+    def _store(self, key: bytes, response: TTSResponse) -> int:
+        """Write an entry to the directory and return the number of bytes written."""
+        audio_path, meta_path = self._paths(key)
+        info = {
+            "content_type": response.content_type,
+            "format": response.format.value,
+            "duration": response.duration,
+            "metadata": response.metadata,
+        }
+        sidecar = json_dumps(info)
+        # Sidecar first: the audio file's mtime marks the entry as complete
+        _write_atomic(meta_path, sidecar)
+        _write_atomic(audio_path, response.audio_data)
+        return len(sidecar) + len(response.audio_data)
+
+    def _prune_disk(self) -> None:
+        """Delete the oldest directory entries until they fit in ``max_disk_bytes``."""
+        # Caller holds the disk lock
+        assert self.directory is not None
+        sizes: Dict[str, int] = {}
+        written_at: Dict[str, float] = {}
+        for path in self.directory.iterdir():
+            if not _ENTRY_NAME.fullmatch(path.name):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            sizes[path.stem] = sizes.get(path.stem, 0) + stat.st_size
+            if path.suffix == ".bin":
+                written_at[path.stem] = stat.st_mtime
+
+        # Sidecars without audio are half-written or orphaned and go first
+        entries: List[Tuple[float, str]] = sorted(
+            (written_at.get(name, 0.0), name) for name in sizes
+        )
+        total = sum(sizes.values())
+        for _, name in entries:
+            if total <= self.max_disk_bytes:
+                break
+            _unlink_quietly(self.directory / f"{name}.bin", self.directory / f"{name}.json")
+            total -= sizes[name]
+        self._disk_size = total
@@ -7,7 +7,25 @@ system dependencies (primarily ffmpeg availability).
 from __future__ import annotations
 
 import shutil
-from typing import Dict, List
+import threading
+from types import MappingProxyType
+from typing import Any, List, Mapping
+
+# Features and formats that can only be served when ffmpeg is installed
+_FFMPEG_FEATURES: frozenset[str] = frozenset(
+    {
+        "speed_adjustment",
+        "format_conversion",
+        "mp3_auto_combine",
+        "opus",
+        "aac",
+        "flac",
+        "pcm",
+    }
+)
+
+# Every feature name the capabilities report knows about
+_ALL_KNOWN_FEATURES: frozenset[str] = _FFMPEG_FEATURES | {"basic_formats", "mp3", "wav"}
 
 
 class SystemCapabilities:
@@ -21,28 +39,42 @@ class SystemCapabilities:
     def __init__(self) -> None:
         """Initialize capabilities detection."""
         self.ffmpeg_available = shutil.which("ffmpeg") is not None
+        self._availability = {
+            name: name not in _FFMPEG_FEATURES or self.ffmpeg_available
+            for name in _ALL_KNOWN_FEATURES
+        }
+        self._report: MappingProxyType | None = None
 
-    def get_capabilities(self) -> Dict:
+    def get_capabilities(self) -> Mapping[str, Any]:
         """Get complete system capabilities report.
 
+        The report is built once on first access and cached; it is returned
+        as a read-only mapping so callers cannot mutate the shared copy.
+
         Returns:
-            Dict containing:
+            Mapping containing:
                 - ffmpeg_available: bool
                 - image_variant: "full" or "slim"
-                - features: dict of feature availability
-                - supported_formats: list of supported audio formats
+                - features: mapping of feature availability
+                - supported_formats: tuple of supported audio formats
         """
-        return {
-            "ffmpeg_available": self.ffmpeg_available,
-            "image_variant": "full" if self.ffmpeg_available else "slim",
-            "features": {
-                "speed_adjustment": self.ffmpeg_available,
-                "format_conversion": self.ffmpeg_available,
-                "mp3_auto_combine": self.ffmpeg_available,
-                "basic_formats": True,  # MP3, WAV always available
-            },
-            "supported_formats": self.get_supported_formats(),
-        }
+        if self._report is None:
+            self._report = MappingProxyType(
+                {
+                    "ffmpeg_available": self.ffmpeg_available,
+                    "image_variant": "full" if self.ffmpeg_available else "slim",
+                    "features": MappingProxyType(
+                        {
+                            "speed_adjustment": self.ffmpeg_available,
+                            "format_conversion": self.ffmpeg_available,
+                            "mp3_auto_combine": self.ffmpeg_available,
+                            "basic_formats": True,  # MP3, WAV always available
+                        }
+                    ),
+                    "supported_formats": tuple(self.get_supported_formats()),
+                }
+            )
+        return self._report
 
     def get_supported_formats(self) -> List[str]:
         """Get list of supported audio formats.
@@ -64,16 +96,7 @@ class SystemCapabilities:
         Returns:
             True if the feature requires ffmpeg, False otherwise
         """
-        ffmpeg_features = {
-            "speed_adjustment",
-            "format_conversion",
-            "mp3_auto_combine",
-            "opus",
-            "aac",
-            "flac",
-            "pcm",
-        }
-        return feature.lower() in ffmpeg_features
+        return feature.lower() in _FFMPEG_FEATURES
 
     def check_feature_available(self, feature: str) -> bool:
         """Check if a specific feature is available.
@@ -84,9 +107,7 @@ class SystemCapabilities:
         Returns:
             True if feature is available, False otherwise
         """
-        if not self.requires_ffmpeg(feature):
-            return True
-        return self.ffmpeg_available
+        return self._availability.get(feature.lower(), True)
 
     def get_unavailable_reason(self, feature: str) -> str | None:
         """Get reason why a feature is unavailable.
@@ -108,15 +129,23 @@ class SystemCapabilities:
 
 # Global instance for easy access
 _capabilities_instance: SystemCapabilities | None = None
+_capabilities_lock = threading.Lock()
 
 
 def get_capabilities() -> SystemCapabilities:
     """Get global SystemCapabilities instance.
 
+    The instance is created at most once, even when several threads race on
+    first access; later calls return it without taking the lock.
+
     Returns:
         SystemCapabilities singleton instance
     """
     global _capabilities_instance
-    if _capabilities_instance is None:
-        _capabilities_instance = SystemCapabilities()
-    return _capabilities_instance
+    instance = _capabilities_instance
+    if instance is None:
+        with _capabilities_lock:
+            instance = _capabilities_instance
+            if instance is None:
+                instance = _capabilities_instance = SystemCapabilities()
+    return instance
@@ -7,13 +7,22 @@ allowing users to generate speech from text using various options.
 """
 
 import argparse
+import functools
 import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from itertools import chain, islice
 from pathlib import Path
+from typing import Dict, cast
 
 from .client import TTSClient
 from .exceptions import APIException, NetworkException, TTSException
-from .models import AudioFormat, TTSResponse, Voice
+from .models import AudioFormat, TTSRequest, TTSResponse, Voice
+from .utils import sanitize_text, split_text_by_length_iter, write_audio_file
+
+# Value -> enum lookups built once at import time
+_VOICE_LOOKUP = {voice.value: voice for voice in Voice}
+_FORMAT_LOOKUP = {audio_format.value: audio_format for audio_format in AudioFormat}
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -108,6 +117,13 @@ Examples:
         "--split-long-text", action="store_true", help="Automatically split long text into chunks"
     )
 
+    parser.add_argument(
+        "--chunk-concurrency",
+        type=int,
+        default=4,
+        help="Number of long-text chunks to generate in parallel (default: 4)",
+    )
+
     parser.add_argument(
         "--auto-combine",
         action="store_true",
@@ -125,6 +141,17 @@ Examples:
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Return a parser shared across ``main()`` calls in the same process.
+
+    ``parse_args`` does not modify the parser, so it can be built once and
+    reused; use ``create_parser()`` when a separate instance is needed.
+    """
+    return create_parser()
+
+
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """Get the package version."""
     try:
@@ -138,8 +165,7 @@ def get_version() -> str:
 def read_text_file(file_path: str) -> str:
     """Read text from a file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read().strip()
+        return Path(file_path).read_text(encoding="utf-8").strip()
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.", file=sys.stderr)
         sys.exit(1)
@@ -158,33 +184,12 @@ def validate_speed(speed: float) -> float:
 
 def get_voice_enum(voice_str: str) -> Voice:
     """Convert voice string to Voice enum."""
-    voice_map = {
-        "alloy": Voice.ALLOY,
-        "ash": Voice.ASH,
-        "ballad": Voice.BALLAD,
-        "coral": Voice.CORAL,
-        "echo": Voice.ECHO,
-        "fable": Voice.FABLE,
-        "nova": Voice.NOVA,
-        "onyx": Voice.ONYX,
-        "sage": Voice.SAGE,
-        "shimmer": Voice.SHIMMER,
-        "verse": Voice.VERSE,
-    }
-    return voice_map[voice_str.lower()]
+    return _VOICE_LOOKUP[voice_str.lower()]
 
 
 def get_format_enum(format_str: str) -> AudioFormat:
     """Convert format string to AudioFormat enum."""
-    format_map = {
-        "mp3": AudioFormat.MP3,
-        "opus": AudioFormat.OPUS,
-        "aac": AudioFormat.AAC,
-        "flac": AudioFormat.FLAC,
-        "wav": AudioFormat.WAV,
-        "pcm": AudioFormat.PCM,
-    }
-    return format_map[format_str.lower()]
+    return _FORMAT_LOOKUP[format_str.lower()]
 
 
 def handle_long_text(  # type: ignore[no-untyped-def]
@@ -201,47 +206,90 @@ def handle_long_text(  # type: ignore[no-untyped-def]
             base_url=args.url, api_key=args.api_key, timeout=args.timeout, max_retries=args.retries
         )
 
-        # Use the new long text method
-        responses = client.generate_speech_long_text(
-            text=text,
-            voice=voice,
-            response_format=audio_format,
-            speed=speed,
-            max_length=args.max_length,
-            preserve_words=True,
-            auto_combine=args.auto_combine,
-        )
-
-        if not responses:
-            print("Error: No valid text chunks found after processing.", file=sys.stderr)
-            sys.exit(1)
-        if isinstance(responses, TTSResponse):
-            combined_response = responses
+        if args.auto_combine:
+            # Combining needs every chunk in memory anyway; with auto_combine
+            # the client always returns a single response
+            combined_response = cast(
+                TTSResponse,
+                client.generate_speech_long_text(
+                    text=text,
+                    voice=voice,
+                    response_format=audio_format,
+                    speed=speed,
+                    max_length=args.max_length,
+                    preserve_words=True,
+                    auto_combine=True,
+                ),
+            )
             combined_response.save_to_file(args.output)
             print(f"Generated combined audio: {args.output}")
             return
 
-        print(f"Generated {len(responses)} audio chunks")
+        chunks = split_text_by_length_iter(
+            sanitize_text(text), args.max_length, preserve_words=True
+        )
 
-        base_name, ext = os.path.splitext(args.output)
+        # Peek ahead so we know whether to number the output files
+        head = list(islice(chunks, 2))
+        if not head:
+            print("Error: No valid text chunks found after processing.", file=sys.stderr)
+            sys.exit(1)
+        single_chunk = len(head) == 1
 
-        for i, response in enumerate(responses, 1):
-            if args.verbose:
-                print(f"Saving chunk {i}/{len(responses)}...")
+        base_name, ext = os.path.splitext(args.output)
 
-            if len(responses) == 1:
-                output_file = args.output
-            else:
-                output_file = f"{base_name}_part{i:03d}{ext}"
+        def generate_chunk(request: TTSRequest, output_file: str) -> str:
+            # Write from the worker so each chunk's audio is released right away
+            response = client.generate_speech_from_request(request)
+            write_audio_file(output_file, response.audio_data)
+            return output_file
 
-            with open(output_file, "wb") as f:
-                f.write(response.audio_data)
+        # Chunks are independent requests, so overlap their network round trips.
+        # At most ``chunk_concurrency`` chunks are in flight, so the rest of the
+        # text is not split (or queued) until a slot frees up.
+        concurrency = max(1, args.chunk_concurrency)
+        total = 0
 
+        def report(future: "Future[str]", index: int) -> None:
+            output_file = future.result()
+            if args.verbose:
+                print(f"Saved chunk {index}")
             print(f"Generated: {output_file}")
 
-        if len(responses) > 1:
-            print(f"\nGenerated {len(responses)} audio files from long text.")
-            print(f"Files: {base_name}_part001{ext} to {base_name}_part{len(responses):03d}{ext}")
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight: Dict["Future[str]", int] = {}
+            try:
+                for i, chunk in enumerate(chain(head, chunks), 1):
+                    if len(in_flight) >= concurrency:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            report(future, in_flight.pop(future))
+
+                    request = TTSRequest(
+                        input=chunk,
+                        voice=voice,
+                        response_format=audio_format,
+                        speed=speed,
+                        max_length=args.max_length,
+                        validate_length=False,  # We already split the text
+                    )
+                    if single_chunk:
+                        output_file = args.output
+                    else:
+                        output_file = f"{base_name}_part{i:03d}{ext}"
+                    in_flight[executor.submit(generate_chunk, request, output_file)] = i
+                    total = i
+
+                for future in as_completed(in_flight):
+                    report(future, in_flight[future])
+            except BaseException:
+                for pending in in_flight:
+                    pending.cancel()
+                raise
+
+        if total > 1:
+            print(f"\nGenerated {total} audio files from long text.")
+            print(f"Files: {base_name}_part001{ext} to {base_name}_part{total:03d}{ext}")
 
     except Exception as e:
         print(f"Error processing long text: {e}", file=sys.stderr)
@@ -254,7 +302,7 @@ def handle_long_text(  # type: ignore[no-untyped-def]
 
 def main() -> None:
     """Main CLI entry point."""
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args()
 
     # Get text input
@@ -273,24 +321,25 @@ def main() -> None:
     audio_format = get_format_enum(args.format)
 
     # Create output directory if needed
-    output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
 
     # Check text length and handle accordingly
     text_length = len(text)
     validate_length = not args.no_length_validation
 
     if args.verbose:
-        print(f"Text: {text[:50]}{'...' if len(text) > 50 else ''}")
-        print(f"Text length: {text_length} characters")
-        print(f"Max length: {args.max_length}")
-        print(f"Length validation: {'enabled' if validate_length else 'disabled'}")
-        print(f"Voice: {args.voice}")
-        print(f"Format: {args.format}")
-        print(f"Speed: {speed}")
-        print(f"URL: {args.url}")
-        print(f"Output: {args.output}")
-        print()
+        # Emit the summary as a single write
+        sys.stdout.write(
+            f"Text: {text[:50]}{'...' if len(text) > 50 else ''}\n"
+            f"Text length: {text_length} characters\n"
+            f"Max length: {args.max_length}\n"
+            f"Length validation: {'enabled' if validate_length else 'disabled'}\n"
+            f"Voice: {args.voice}\n"
+            f"Format: {args.format}\n"
+            f"Speed: {speed}\n"
+            f"URL: {args.url}\n"
+            f"Output: {args.output}\n\n"
+        )
 
     # Handle long text
     if text_length > args.max_length:
@@ -330,8 +379,7 @@ def main() -> None:
         )
 
         # Save to file
-        with open(args.output, "wb") as f:
-            f.write(response.audio_data)
+        write_audio_file(args.output, response.audio_data)
 
         print(f"Speech generated successfully: {args.output}")
 
@@ -5,36 +5,64 @@ This module provides the primary TTSClient class for synchronous
 text-to-speech generation with OpenAI-compatible API.
 """
 
-import json
+import itertools
 import logging
+import os
 import threading
-import time
 import uuid
-from typing import Dict, List, Optional, Union
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .audio import combine_responses
+try:  # Optional dependency for the HTTP/2 transport
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from .audio import build_tts_response, combine_responses, concatenate_responses
+from .cache import (
+    DEFAULT_CACHE_DIR_MAX_BYTES,
+    DEFAULT_CACHE_MAX_BYTES,
+    ResponseCache,
+    make_cache_key,
+)
+from .dns_cache import DNSCache, DNSCachingAdapter, KeepAliveAdapter
 from .exceptions import (
-    APIException,
     NetworkException,
-    TTSException,
     ValidationException,
     create_exception_from_response,
+    parse_error_body,
 )
 from .models import (
+    DEFAULT_PROMPT,
     AudioFormat,
     TTSRequest,
     TTSResponse,
     Voice,
+    get_content_type,
 )
 from .utils import (
+    RETRY_STATUS_CODES,
     build_url,
-    estimate_audio_duration,
-    exponential_backoff,
-    format_file_size,
     get_realistic_headers,
     sanitize_text,
     split_text_by_length,
@@ -43,13 +71,102 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Format-selection headers. openai.fm answers minimal headers with MP3 and
+# browser-like headers with WAV; every other format is converted from WAV.
+_MP3_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+)
+_WAV_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/121.0.0.0 Safari/537.36"
+        ),
+        "Accept": "audio/*,*/*;q=0.9",
+    }
+)
+_HEADERS_BY_FORMAT: Mapping[AudioFormat, Mapping[str, str]] = {AudioFormat.MP3: _MP3_HEADERS}
+
+# Compiled request functions kept per client, one per voice/format/prompt
+_MAX_REQUEST_FNS = 32
+
+# Size of the reads used when streaming audio bodies off the socket
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Largest announced Content-Length trusted for allocating the body up front
+_MAX_PRESIZED_BODY = 64 * 1024 * 1024
+
+# Transport errors mapped to NetworkException, covering httpx when installed
+_TIMEOUT_ERRORS: Tuple[Type[Exception], ...] = (requests.exceptions.Timeout,)
+_CONNECTION_ERRORS: Tuple[Type[Exception], ...] = (requests.exceptions.ConnectionError,)
+_REQUEST_ERRORS: Tuple[Type[Exception], ...] = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECTION_ERRORS += (httpx.NetworkError,)
+    _REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+def _expected_body_length(response: Any) -> int:
+    """Return the decoded body size announced by the server, or 0 if unknown."""
+    headers = response.headers
+    if headers.get("content-encoding"):
+        # Content-Length counts compressed bytes; the decoded size is unknown
+        return 0
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        return 0
+    return length if 0 < length <= _MAX_PRESIZED_BODY else 0
+
+
+def _iter_response_body(response: Any) -> Iterator[bytes]:
+    """Iterate over a streamed ``requests`` or ``httpx`` response body."""
+    iter_bytes = getattr(response, "iter_bytes", None)
+    if iter_bytes is not None:
+        return iter_bytes(_STREAM_CHUNK_SIZE)
+    return response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+
+
+def _read_response_body(response: Any) -> bytes:
+    """Read a streamed ``requests`` or ``httpx`` response body into a single buffer.
+
+    When the server announces the body size the buffer is allocated once and
+    filled in place; otherwise chunks are appended to one growing ``bytearray``.
+    Either way no list of chunks is kept around to be joined.
+    """
+    chunks = _iter_response_body(response)
+
+    expected = _expected_body_length(response)
+    buffer = bytearray(expected)
+    view = memoryview(buffer)
+    filled = 0
+    for chunk in chunks:
+        end = filled + len(chunk)
+        if end <= expected:
+            view[filled:end] = chunk
+        else:
+            # Server sent more than announced: fall back to appending
+            view.release()
+            del buffer[filled:]
+            buffer += chunk
+            view = memoryview(buffer)
+            expected = end
+        filled = end
+    view.release()
+
+    if filled < len(buffer):
+        del buffer[filled:]
+    return bytes(buffer)
+
 
 class TTSClient:
     """
     Synchronous TTS client for text-to-speech generation.
 
     This client provides a simple interface for generating speech from text
-    using OpenAI-compatible TTS services.
+    using OpenAI-compatible TTS services. A single instance can be shared
+    across threads; concurrent calls reuse the session's connection pool.
 
     Attributes:
         base_url: Base URL for the TTS service
@@ -59,6 +176,11 @@ class TTSClient:
         verify_ssl: Whether to verify SSL certificates
     """
 
+    # Process-wide sessions for clients created with shared_session=True,
+    # one per combination of the settings baked into a session
+    _shared_sessions: Dict[Tuple[Any, ...], requests.Session] = {}
+    _shared_session_lock = threading.Lock()
+
     def __init__(
         self,
         base_url: str = "https://www.openai.fm",
@@ -69,6 +191,22 @@ class TTSClient:
         preferred_format: Optional[AudioFormat] = None,
         default_headers: Optional[Dict[str, str]] = None,
         use_default_prompt: bool = False,
+        default_prompt: Optional[str] = None,
+        include_response_headers: bool = False,
+        legacy_metadata: bool = False,
+        estimate_duration: bool = True,
+        cache_size: int = 0,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        cache_dir: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_dir_max_bytes: int = DEFAULT_CACHE_DIR_MAX_BYTES,
+        http2: bool = False,
+        pool_connections: int = 100,
+        pool_maxsize: int = 100,
+        pool_block: bool = False,
+        batch_concurrency: int = 4,
+        dns_cache_ttl: Optional[float] = None,
+        shared_session: bool = False,
         **kwargs,  # type: ignore[no-untyped-def]
     ) -> None:
         """
@@ -81,6 +219,46 @@ class TTSClient:
             max_retries: Maximum retry attempts
             verify_ssl: Whether to verify SSL certificates
             preferred_format: Preferred audio format (affects header selection)
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum keep-alive connections per pool; size this to
+                the number of concurrent requests so none fall back to a new
+                TCP/TLS handshake. Each pooled connection holds a file descriptor
+            pool_block: Whether requests wait for a free pooled connection when
+                all ``pool_maxsize`` are busy, instead of opening a throwaway one
+            batch_concurrency: Default number of chunk requests a batch keeps in
+                flight at once; the connection pool is sized to at least this
+            dns_cache_ttl: Seconds to cache host name lookups for new
+                connections. Off by default (``None``), so every new connection
+                resolves the host and picks up DNS changes at once; pass e.g.
+                ``dns_cache_ttl=300`` to skip the lookup for connections opened
+                within that window
+            default_prompt: Prompt to send when a request has no instructions;
+                setting it implies ``use_default_prompt``
+            include_response_headers: Whether to copy a small set of response
+                headers (content type/length, request id) into response metadata
+            legacy_metadata: Deprecated. Also fill the metadata keys that are no
+                longer set by default: ``original_text`` (a 100-character preview
+                of the input) and ``response_headers`` with every header
+            estimate_duration: Whether to fill ``TTSResponse.duration`` with a
+                text-based estimate; disable to skip the word count per response
+            cache_size: Number of responses to keep in an in-memory LRU cache so
+                identical requests skip the network; ``0`` disables the memory layer
+            cache_max_bytes: Upper bound on the total audio bytes cached in memory
+            cache_dir: Directory to persist cached responses in, so repeats are
+                served across processes; enables caching even when
+                ``cache_size`` is ``0``
+            cache_ttl: Seconds a cached response stays valid; ``None`` keeps
+                entries until they are evicted
+            cache_dir_max_bytes: Upper bound on the total size of ``cache_dir``;
+                the oldest entries are deleted to stay under it
+            http2: Send requests through ``httpx`` over HTTP/2 so concurrent
+                requests share one connection (requires ``ttsfm[http2]``). This
+                transport retries failed connections only, not error statuses.
+            shared_session: Reuse one process-wide ``requests`` session across
+                clients, e.g. for repeated short-lived clients in a CLI or a
+                warm serverless container. Only clients with the same retries,
+                pool sizes, SSL verification, DNS cache TTL, API key and headers
+                share a session. It is not closed by ``close()``.
             **kwargs: Additional configuration options
         """
         self.base_url = base_url.rstrip("/")
@@ -90,38 +268,179 @@ class TTSClient:
         self.verify_ssl = verify_ssl
         self.preferred_format = preferred_format or AudioFormat.WAV
         self.use_default_prompt = use_default_prompt
+        self.batch_concurrency = batch_concurrency
+        self.include_response_headers = include_response_headers
+        self.legacy_metadata = legacy_metadata
+        if legacy_metadata:
+            warnings.warn(
+                "legacy_metadata is deprecated and will be removed in a future release; "
+                "use metadata['text_length'] and include_response_headers instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        self.estimate_duration = estimate_duration
         self.default_headers = default_headers or {}
 
         # Validate base URL
         if not validate_url(self.base_url):
             raise ValidationException(f"Invalid base URL: {self.base_url}")
 
+        # Concurrent batch chunks must never fall back to throwaway
+        # connections, so batch_concurrency is a floor on the pool size
+        pool_size = max(pool_maxsize, batch_concurrency)
+
         # Setup HTTP session with retry strategy
-        self.session = requests.Session()
-        self._session_lock = threading.RLock()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST"],  # Updated parameter name
-            backoff_factor=1,
+        self._owns_session = not shared_session
+        if shared_session:
+            session_key = (
+                verify_ssl,
+                max_retries,
+                pool_connections,
+                pool_size,
+                pool_block,
+                dns_cache_ttl,
+                api_key,
+                tuple(sorted(self.default_headers.items())),
+            )
+            with TTSClient._shared_session_lock:
+                session = TTSClient._shared_sessions.get(session_key)
+                if session is None:
+                    session = self._build_session(
+                        pool_connections, pool_size, pool_block, dns_cache_ttl
+                    )
+                    TTSClient._shared_sessions[session_key] = session
+            self.session = session
+        else:
+            self.session = self._build_session(
+                pool_connections, pool_size, pool_block, dns_cache_ttl
+            )
+
+        # Kept for invalidating lookups after connection failures
+        self._dns_cache: Optional[DNSCache] = getattr(
+            self.session.get_adapter(self.base_url), "dns_cache", None
+        )
+
+        # Optional HTTP/2 transport multiplexing concurrent requests
+        self._http2_client: Optional["httpx.Client"] = None
+        if http2:
+            if httpx is None:
+                raise RuntimeError(
+                    "HTTP/2 support requires httpx. Install it with: pip install 'ttsfm[http2]'"
+                )
+            # httpx only takes str values; requests allows bytes as well
+            http2_headers: Dict[str, str] = {
+                name: value if isinstance(value, str) else value.decode("latin-1")
+                for name, value in self.session.headers.items()
+            }
+            self._http2_client = httpx.Client(
+                headers=http2_headers,
+                timeout=timeout,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    verify=verify_ssl,
+                    retries=max_retries,
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size,
+                    ),
+                ),
+            )
+
+        self._response_cache: Optional[ResponseCache] = None
+        if cache_size > 0 or cache_dir:
+            self._response_cache = ResponseCache(
+                cache_size,
+                cache_max_bytes,
+                directory=cache_dir,
+                ttl=cache_ttl,
+                max_disk_bytes=cache_dir_max_bytes,
+            )
+
+        # Generation ids only need to be unique: one random prefix per client
+        # plus a counter avoids an urandom call for every request
+        self._generation_prefix = int.from_bytes(os.urandom(8), "big")
+        self._generation_counter = itertools.count()
+
+        # Per-request invariants, resolved once
+        self._generate_url = build_url(self.base_url, "api/generate")
+        self._default_prompt: Optional[str] = default_prompt or (
+            DEFAULT_PROMPT if use_default_prompt else None
         )
+        self._request_fns: Dict[
+            Tuple[Voice, AudioFormat, Optional[str]], Callable[[TTSRequest], TTSResponse]
+        ] = {}
 
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=10)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        logger.info("Initialized TTS client with base URL: %s", self.base_url)
+
+    def _build_session(
+        self,
+        pool_connections: int,
+        pool_size: int,
+        pool_block: bool,
+        dns_cache_ttl: Optional[float],
+    ) -> requests.Session:
+        """
+        Create the ``requests`` session with this client's retry policy and pool.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_size: Maximum keep-alive connections per pool
+            pool_block: Whether to wait for a free connection when the pool is full
+            dns_cache_ttl: Seconds to cache host name lookups; falsy disables
+
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        # Set once here rather than per call, sparing requests a settings merge
+        session.verify = self.verify_ssl
+
+        # Configure retry strategy. urllib3 handles every retry (connection
+        # errors, timeouts and retryable statuses) and honours Retry-After.
+        retry_kwargs: Dict[str, Any] = {
+            "total": self.max_retries,
+            "status_forcelist": RETRY_STATUS_CODES,
+            "allowed_methods": frozenset(["POST"]),
+            "backoff_factor": 0.5,
+            "respect_retry_after_header": True,
+            "raise_on_status": False,
+        }
+        try:
+            retry_strategy = Retry(backoff_jitter=0.5, **retry_kwargs)
+        except TypeError:  # urllib3 < 2.0 has no backoff_jitter
+            retry_strategy = Retry(**retry_kwargs)
+
+        adapter_kwargs: Dict[str, Any] = {
+            "max_retries": retry_strategy,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_size,
+            "pool_block": pool_block,
+        }
+
+        # One adapter (and pool manager) shared by both schemes
+        adapter: HTTPAdapter
+        if dns_cache_ttl:
+            adapter = DNSCachingAdapter(DNSCache(ttl=dns_cache_ttl), **adapter_kwargs)
+        else:
+            adapter = KeepAliveAdapter(**adapter_kwargs)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
 
         # Set default headers
         base_headers = get_realistic_headers(self.default_headers)
-        self.session.headers.update(base_headers)
+        session.headers.update(base_headers)
 
         if self.api_key:
-            self.session.headers["Authorization"] = f"Bearer {self.api_key}"
+            session.headers["Authorization"] = f"Bearer {self.api_key}"
+
+        return session
 
-        logger.info(f"Initialized TTS client with base URL: {self.base_url}")
+    def clear_cache(self) -> None:
+        """Drop every cached response, including those in ``cache_dir``."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
 
-    def _get_headers_for_format(self, requested_format: AudioFormat) -> Dict[str, str]:
+    def _get_headers_for_format(self, requested_format: AudioFormat) -> Mapping[str, str]:
         """
         Get appropriate headers to get the desired base format from openai.fm.
 
@@ -135,22 +454,9 @@ class TTSClient:
             requested_format: The desired audio format
 
         Returns:
-            Dict[str, str]: HTTP headers optimized for the base format
+            Mapping[str, str]: Read-only HTTP headers for the base format
         """
-        # For MP3, use minimal headers
-        if requested_format == AudioFormat.MP3:
-            return {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-
-        # For all other formats, request WAV from openai.fm (we'll convert later if needed)
-        # Use more complex headers to get WAV response
-        return {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/121.0.0.0 Safari/537.36"
-            ),
-            "Accept": "audio/*,*/*;q=0.9",
-        }
+        return _HEADERS_BY_FORMAT.get(requested_format, _WAV_HEADERS)
 
     def _get_content_type_for_format(self, audio_format: AudioFormat) -> str:
         """
@@ -162,15 +468,7 @@ class TTSClient:
         Returns:
             str: The MIME type for the format
         """
-        format_to_mime = {
-            AudioFormat.MP3: "audio/mpeg",
-            AudioFormat.WAV: "audio/wav",
-            AudioFormat.OPUS: "audio/opus",
-            AudioFormat.AAC: "audio/aac",
-            AudioFormat.FLAC: "audio/flac",
-            AudioFormat.PCM: "audio/pcm",
-        }
-        return format_to_mime.get(audio_format, "audio/mpeg")
+        return get_content_type(audio_format)
 
     def generate_speech(
         self,
@@ -180,6 +478,7 @@ class TTSClient:
         instructions: Optional[str] = None,
         max_length: int = 1000,
         validate_length: bool = True,
+        skip_sanitize: bool = False,
         **kwargs,  # type: ignore[no-untyped-def]
     ) -> TTSResponse:
         """
@@ -192,6 +491,8 @@ class TTSClient:
             instructions: Optional instructions for voice modulation
             max_length: Maximum allowed text length in characters (default: 1000)
             validate_length: Whether to validate text length (default: True)
+            skip_sanitize: Send ``text`` as-is, for input that is already clean
+                (default: False)
             **kwargs: Additional parameters
 
         Returns:
@@ -203,7 +504,7 @@ class TTSClient:
         """
         # Create and validate request
         request = TTSRequest(
-            input=sanitize_text(text),
+            input=text if skip_sanitize else sanitize_text(text),
             voice=voice,
             response_format=response_format,
             instructions=instructions,
@@ -214,6 +515,83 @@ class TTSClient:
 
         return self._make_request(request)
 
+    @contextmanager
+    def generate_speech_stream(
+        self,
+        text: str,
+        voice: Union[Voice, str] = Voice.ALLOY,
+        response_format: Union[AudioFormat, str] = AudioFormat.MP3,
+        instructions: Optional[str] = None,
+        max_length: int = 1000,
+        validate_length: bool = True,
+        skip_sanitize: bool = False,
+        **kwargs,  # type: ignore[no-untyped-def]
+    ) -> Iterator[Tuple[Mapping[str, str], Iterator[bytes]]]:
+        """
+        Generate speech and stream the audio as it arrives from openai.fm.
+
+        Used as a context manager; the upstream connection is released on exit::
+
+            with client.generate_speech_stream("Hello") as (headers, chunks):
+                for chunk in chunks:
+                    output.write(chunk)
+
+        The audio is passed through untouched, so it is MP3 when MP3 is
+        requested and WAV for every other format (no ffmpeg conversion).
+        Responses are neither cached nor speed-adjusted.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for generation
+            response_format: Audio format for output (MP3, otherwise WAV)
+            instructions: Optional instructions for voice modulation
+            max_length: Maximum allowed text length in characters (default: 1000)
+            validate_length: Whether to validate text length (default: True)
+            skip_sanitize: Send ``text`` as-is, for input that is already clean
+                (default: False)
+            **kwargs: Additional parameters
+
+        Yields:
+            Tuple[Mapping[str, str], Iterator[bytes]]: Upstream response headers
+            and an iterator over the audio bytes
+
+        Raises:
+            TTSException: If the request fails
+            ValueError: If the request is invalid or asks for a speed change
+        """
+        request = TTSRequest(
+            input=text if skip_sanitize else sanitize_text(text),
+            voice=voice,
+            response_format=response_format,
+            instructions=instructions,
+            max_length=max_length,
+            validate_length=validate_length,
+            **kwargs,
+        )
+        if request.speed is not None and request.speed != 1.0:
+            raise ValueError("Speed adjustment is not supported when streaming")
+
+        base_format = (
+            AudioFormat.MP3 if request.response_format == AudioFormat.MP3 else AudioFormat.WAV
+        )
+        form_data = {
+            "input": request.input,
+            "voice": getattr(request.voice, "value", request.voice),
+            "generation": self._next_generation_id(),
+            "response_format": base_format.value,
+        }
+        prompt = request.instructions or self._default_prompt
+        if prompt:
+            form_data["prompt"] = prompt
+
+        response = self._post(form_data, self._get_headers_for_format(base_format))
+        try:
+            if not 200 <= response.status_code < 300:
+                self._raise_for_status(response)
+            yield response.headers, _iter_response_body(response)
+        finally:
+            response.close()
+
     def generate_speech_from_request(self, request: TTSRequest) -> TTSResponse:
         """
         Generate speech from a TTSRequest object.
@@ -234,13 +612,16 @@ class TTSClient:
         instructions: Optional[str] = None,
         max_length: int = 1000,
         preserve_words: bool = True,
+        max_concurrency: Optional[int] = None,
+        skip_sanitize: bool = False,
         **kwargs,  # type: ignore[no-untyped-def]
     ) -> List[TTSResponse]:
         """
         Generate speech from long text by splitting it into chunks.
 
         This method automatically splits text that exceeds max_length into
-        smaller chunks and generates speech for each chunk separately.
+        smaller chunks and generates speech for the chunks concurrently over
+        the client's shared connection pool.
 
         Args:
             text: Text to convert to speech
@@ -249,6 +630,10 @@ class TTSClient:
             instructions: Optional instructions for voice modulation
             max_length: Maximum length per chunk (default: 1000)
             preserve_words: Whether to avoid splitting words (default: True)
+            max_concurrency: Maximum number of chunk requests in flight
+                (default: the client's ``batch_concurrency``)
+            skip_sanitize: Split ``text`` as-is, for input that is already clean
+                (default: False)
             **kwargs: Additional parameters
 
         Returns:
@@ -260,7 +645,7 @@ class TTSClient:
         """
 
         # Sanitize text first
-        clean_text = sanitize_text(text)
+        clean_text = text if skip_sanitize else sanitize_text(text)
 
         # Split text into chunks
         chunks = split_text_by_length(clean_text, max_length, preserve_words)
@@ -268,26 +653,55 @@ class TTSClient:
         if not chunks:
             raise ValueError("No valid text chunks found after processing")
 
-        responses = []
-
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Processing chunk {i+1}/{len(chunks)} ({len(chunk)} characters)")
+        # Validate voice, format and options once, then stamp out the other
+        # chunks from that template (length validation is off: already split)
+        template = TTSRequest(
+            input=chunks[0],
+            voice=voice,
+            response_format=response_format,
+            instructions=instructions,
+            max_length=max_length,
+            validate_length=False,
+            **kwargs,
+        )
+        requests_list = [template]
+        requests_list.extend(template.with_input(chunk) for chunk in chunks[1:])
+
+        # Every chunk shares voice, format and instructions: specialise once
+        do_request = self._request_fn(
+            cast(Voice, template.voice),
+            cast(AudioFormat, template.response_format),
+            template.instructions,
+        )
 
-            # Create request for this chunk (disable length validation since we already split)
-            request = TTSRequest(
-                input=chunk,
-                voice=voice,
-                response_format=response_format,
-                instructions=instructions,
-                max_length=max_length,
-                validate_length=False,  # We already split the text
-                **kwargs,
+        def process_chunk(index: int, request: TTSRequest) -> TTSResponse:
+            logger.info(
+                "Processing chunk %d/%d (%d characters)",
+                index + 1,
+                len(requests_list),
+                len(request.input),
             )
+            return do_request(request)
 
-            response = self._make_request(request)
-            responses.append(response)
+        if max_concurrency is None:
+            max_concurrency = self.batch_concurrency
 
-        return responses
+        if max_concurrency <= 1 or len(requests_list) == 1:
+            return [process_chunk(i, request) for i, request in enumerate(requests_list)]
+
+        # Chunks are independent, so overlap their round trips to the service
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(requests_list))) as executor:
+            futures = [
+                executor.submit(process_chunk, i, request)
+                for i, request in enumerate(requests_list)
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # Fail fast: drop chunks that have not started yet
+                for future in futures:
+                    future.cancel()
+                raise
 
     def generate_speech_long_text(
         self,
@@ -345,6 +759,52 @@ class TTSClient:
 
         return responses
 
+    def generate_speech_batch_concat(
+        self,
+        text: str,
+        voice: Union[Voice, str] = Voice.ALLOY,
+        response_format: Union[AudioFormat, str] = AudioFormat.MP3,
+        instructions: Optional[str] = None,
+        max_length: int = 1000,
+        preserve_words: bool = True,
+        **kwargs,  # type: ignore[no-untyped-def]
+    ) -> TTSResponse:
+        """
+        Generate speech for long text and return the chunks joined into one response.
+
+        Chunks are generated like :meth:`generate_speech_batch` and then joined
+        byte-for-byte without re-encoding, so unlike ``auto_combine`` this needs
+        neither pydub nor ffmpeg. WAV chunks get a single rewritten header; MP3
+        and other frame-based formats are simply appended, which players handle.
+        Container formats that do not support appending (e.g. FLAC) should use
+        :meth:`generate_speech_long_text` with ``auto_combine=True`` instead.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for generation
+            response_format: Audio format for output
+            instructions: Optional instructions for voice modulation
+            max_length: Maximum length per chunk (default: 1000)
+            preserve_words: Whether to avoid splitting words (default: True)
+            **kwargs: Additional parameters passed to generate_speech_batch
+
+        Returns:
+            TTSResponse: Single response holding the joined audio
+
+        Raises:
+            TTSException: If generation fails for any chunk
+        """
+        responses = self.generate_speech_batch(
+            text=text,
+            voice=voice,
+            response_format=response_format,
+            instructions=instructions,
+            max_length=max_length,
+            preserve_words=preserve_words,
+            **kwargs,
+        )
+        return concatenate_responses(responses)
+
     @staticmethod
     def _normalise_format_value(response_format: Union[AudioFormat, str]) -> str:
         if isinstance(response_format, AudioFormat):
@@ -383,142 +843,195 @@ class TTSClient:
         Raises:
             TTSException: If request fails
         """
-        url = build_url(self.base_url, "api/generate")
-
-        # Prepare form data for openai.fm API
-        voice_value = (
-            request.voice.value if isinstance(request.voice, Voice) else str(request.voice)
-        )
-        format_value = (
-            request.response_format.value
-            if isinstance(request.response_format, AudioFormat)
-            else str(request.response_format)
+        do_request = self._request_fn(
+            cast(Voice, request.voice),
+            cast(AudioFormat, request.response_format),
+            request.instructions,
         )
+        return do_request(request)
 
-        form_data = {
-            "input": request.input,
-            "voice": voice_value,
-            "generation": str(uuid.uuid4()),
-            "response_format": format_value,
-        }
+    def _request_fn(
+        self,
+        voice: Voice,
+        response_format: AudioFormat,
+        instructions: Optional[str],
+    ) -> Callable[[TTSRequest], TTSResponse]:
+        """Return the compiled request function for a voice, format and prompt."""
+        key = (voice, response_format, instructions)
+        do_request = self._request_fns.get(key)
+        if do_request is None:
+            # Prompts are free text; bound the table rather than grow it forever
+            if len(self._request_fns) >= _MAX_REQUEST_FNS:
+                self._request_fns.clear()
+            do_request = self._compile_request_fn(voice, response_format, instructions)
+            self._request_fns[key] = do_request
+        return do_request
+
+    def _compile_request_fn(
+        self,
+        voice: Voice,
+        response_format: AudioFormat,
+        instructions: Optional[str],
+    ) -> Callable[[TTSRequest], TTSResponse]:
+        """
+        Build a request function specialised for one voice, format and prompt.
 
-        # Add prompt/instructions if provided
-        if request.instructions:
-            form_data["prompt"] = request.instructions
-        elif self.use_default_prompt:
-            # Default prompt for better quality
-            form_data["prompt"] = (
-                "Affect/personality: Natural and clear\n\n"
-                "Tone: Friendly and professional, creating a pleasant "
-                "listening experience.\n\n"
-                "Pronunciation: Clear, articulate, and steady, ensuring "
-                "each word is easily understood while maintaining a "
-                "natural, conversational flow.\n\n"
-                "Pause: Brief, purposeful pauses between sentences to "
-                "allow time for the listener to process the information.\n\n"
-                "Emotion: Warm and engaging, conveying the intended "
-                "message effectively."
-            )
-        # Convert string format to AudioFormat enum if needed
-        requested_format = request.response_format
-        if isinstance(requested_format, str):
-            try:
-                requested_format = AudioFormat(requested_format.lower())
-            except ValueError:
-                requested_format = AudioFormat.MP3  # Default to MP3 for unknown formats
+        Everything that depends only on these values (base format and header
+        selection, prompt fallback) is resolved here once, so batches
+        that share them only pay for building the form and the round trip.
+
+        Args:
+            voice: Voice shared by the requests, as normalised by ``TTSRequest``
+            response_format: Requested audio format shared by the requests, as
+                normalised by ``TTSRequest``
+            instructions: Instructions shared by the requests
+
+        Returns:
+            Callable[[TTSRequest], TTSResponse]: Function sending one request
+            whose voice, format and instructions match the arguments
+        """
+        voice_value = voice.value
+        requested_format = response_format
 
         # Determine base format to request from openai.fm
         # We request MP3 or WAV, then convert to other formats using ffmpeg
         if requested_format == AudioFormat.MP3:
             base_format = AudioFormat.MP3
+            format_headers = _MP3_HEADERS
         else:
             # For all other formats (WAV, OPUS, AAC, FLAC, PCM), request WAV
             base_format = AudioFormat.WAV
+            format_headers = _WAV_HEADERS
 
-        form_data["response_format"] = base_format.value
-        format_headers = self._get_headers_for_format(requested_format)
+        base_value = base_format.value
+        target_value = requested_format.value
 
-        logger.info(
-            f"Generating speech for text: '{request.input[:50]}...' with voice: {request.voice}"
-        )
-        logger.debug(
-            f"Requesting {base_format.value} from openai.fm (target format: {requested_format.value})"
-        )
+        # Add prompt/instructions if provided, falling back to the default prompt
+        prompt = instructions or self._default_prompt
+        response_cache = self._response_cache
+        base_url = self.base_url
+
+        def do_request(request: TTSRequest) -> TTSResponse:
+            cache_key: Optional[bytes] = None
+            if response_cache is not None:
+                cache_key = make_cache_key(
+                    base_url, request.input, voice_value, target_value, prompt, request.speed
+                )
+                cached = response_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Serving speech from response cache")
+                    return cached
+
+            form_data = {
+                "input": request.input,
+                "voice": voice_value,
+                "generation": self._next_generation_id(),
+                "response_format": base_value,
+            }
+            if prompt:
+                form_data["prompt"] = prompt
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Generating speech for text: '%s...' with voice: %s",
+                    request.input[:50],
+                    request.voice,
+                )
+            logger.debug(
+                "Requesting %s from openai.fm (target format: %s)", base_value, target_value
+            )
 
-        # Make request with retries
-        for attempt in range(self.max_retries + 1):
+            response = self._post(form_data, format_headers)
             try:
-                # Add random delay for rate limiting (except first attempt)
-                if attempt > 0:
-                    delay = exponential_backoff(attempt - 1)
-                    logger.info(f"Retrying request after {delay:.2f}s (attempt {attempt + 1})")
-                    time.sleep(delay)
-
-                # Use multipart form data as required by openai.fm
-                payload = dict(form_data)
-                with self._session_lock:
-                    response = self.session.post(
-                        url,
-                        data=payload,
-                        headers=format_headers,
-                        timeout=self.timeout,
-                        verify=self.verify_ssl,
-                    )
+                if 200 <= response.status_code < 300:
+                    tts_response = self._process_openai_fm_response(response, request)
+                    if cache_key is not None and response_cache is not None:
+                        response_cache.put(cache_key, tts_response)
+                    return tts_response
 
-                # Handle different response types
-                if response.status_code == 200:
-                    return self._process_openai_fm_response(response, request)
-                else:
-                    # Try to parse error response
-                    try:
-                        error_data = response.json()
-                    except (json.JSONDecodeError, ValueError):
-                        error_data = {"error": {"message": response.text or "Unknown error"}}
-
-                    # Create appropriate exception
-                    exception = create_exception_from_response(
-                        response.status_code,
-                        error_data,
-                        f"TTS request failed with status {response.status_code}",
-                    )
+                self._raise_for_status(response)
+            finally:
+                # Streamed responses hold their connection until closed
+                response.close()
 
-                    # Don't retry for certain errors
-                    if response.status_code in [400, 401, 403, 404]:
-                        raise exception
+        return do_request
 
-                    # For retryable errors, continue to next attempt
-                    if attempt == self.max_retries:
-                        raise exception
+    def _next_generation_id(self) -> str:
+        """Return a generation id unique to this client and request.
 
-                    logger.warning(
-                        f"Request failed with status {response.status_code}, retrying..."
-                    )
-                    continue
-
-            except requests.exceptions.Timeout:
-                if attempt == self.max_retries:
-                    raise NetworkException(
-                        f"Request timed out after {self.timeout}s",
-                        timeout=self.timeout,
-                        retry_count=attempt,
-                    )
-                logger.warning("Request timed out, retrying...")
-                continue
+        The id keeps the UUID4 shape openai.fm has always been sent: the client
+        prefix fills the high 64 bits and the request counter the low ones.
+        """
+        value = (self._generation_prefix << 64) | next(self._generation_counter)
+        return str(uuid.UUID(int=value, version=4))
+
+    def _post(self, form_data: Dict[str, str], headers: Mapping[str, str]) -> Any:
+        """
+        Send the generation form to openai.fm and return the streamed response.
 
-            except requests.exceptions.ConnectionError as e:
-                if attempt == self.max_retries:
-                    raise NetworkException(f"Connection error: {str(e)}", retry_count=attempt)
-                logger.warning("Connection error, retrying...")
-                continue
+        Args:
+            form_data: Form fields for the generate endpoint
+            headers: Format-selection headers for this request
+
+        Returns:
+            The streamed ``requests`` (or ``httpx`` with ``http2=True``) response
 
-            except requests.exceptions.RequestException as e:
-                if attempt == self.max_retries:
-                    raise NetworkException(f"Request error: {str(e)}", retry_count=attempt)
-                logger.warning("Request error, retrying...")
-                continue
+        Raises:
+            NetworkException: If the request times out or cannot be sent
+        """
+        # Retries and backoff are handled by the transport's retry policy
+        try:
+            if self._http2_client is not None:
+                http2_request = self._http2_client.build_request(
+                    "POST", self._generate_url, data=form_data, headers=headers
+                )
+                return self._http2_client.send(http2_request, stream=True)
+
+            # openai.fm accepts the fields as an urlencoded form body
+            return self.session.post(
+                self._generate_url,
+                data=form_data,
+                headers=headers,
+                timeout=self.timeout,
+                stream=True,
+            )
+        except _TIMEOUT_ERRORS:
+            raise NetworkException(
+                f"Request timed out after {self.timeout}s",
+                timeout=self.timeout,
+                retry_count=self.max_retries,
+            )
+        except _CONNECTION_ERRORS as e:
+            if self._dns_cache is not None:
+                # The host may have moved; resolve again on the next connection
+                self._dns_cache.invalidate()
+            raise NetworkException(f"Connection error: {str(e)}", retry_count=self.max_retries)
+        except _REQUEST_ERRORS as e:
+            raise NetworkException(f"Request error: {str(e)}", retry_count=self.max_retries)
+
+    def _raise_for_status(self, response: requests.Response) -> NoReturn:
+        """
+        Raise the exception matching an unsuccessful openai.fm response.
 
-        # This should never be reached, but just in case
-        raise TTSException("Maximum retries exceeded")
+        Args:
+            response: HTTP response with a non-2xx status
+
+        Raises:
+            TTSException: Subclass chosen from the status code and error body
+        """
+        # Only JSON bodies are read in full; error pages just need a preview
+        content_type = response.headers.get("content-type")
+        if content_type and "json" in content_type.lower():
+            body = _read_response_body(response)
+        else:
+            body = next(iter(_iter_response_body(response)), b"")
+        error_data = parse_error_body(content_type, body)
+
+        raise create_exception_from_response(
+            response.status_code,
+            error_data,
+            f"TTS request failed with status {response.status_code}",
+        )
 
     def _process_openai_fm_response(
         self,
@@ -535,172 +1048,25 @@ class TTSClient:
         Returns:
             TTSResponse: Processed response object
         """
-        # Get content type from response headers
-        content_type = response.headers.get("content-type", "audio/mpeg")
-
-        # Get audio data
-        audio_data = response.content
-
-        if not audio_data:
-            raise APIException("Received empty audio data from openai.fm")
-
-        # Determine format from content type
-        if "audio/mpeg" in content_type or "audio/mp3" in content_type:
-            actual_format = AudioFormat.MP3
-        elif "audio/wav" in content_type:
-            actual_format = AudioFormat.WAV
-        elif "audio/opus" in content_type:
-            actual_format = AudioFormat.OPUS
-        elif "audio/aac" in content_type:
-            actual_format = AudioFormat.AAC
-        elif "audio/flac" in content_type:
-            actual_format = AudioFormat.FLAC
-        else:
-            # Default to MP3 for openai.fm
-            actual_format = AudioFormat.MP3
-
-        # Estimate duration based on text length (rough approximation)
-        estimated_duration = estimate_audio_duration(request.input)
-
-        # Normalize requested format
-        requested_format = request.response_format
-        if isinstance(requested_format, str):
-            try:
-                requested_format = AudioFormat(requested_format.lower())
-            except ValueError:
-                requested_format = AudioFormat.MP3  # Default fallback
-
-        # Apply speed adjustment if requested (requires ffmpeg)
-        speed_applied = False
-        if request.speed is not None and request.speed != 1.0:
-            try:
-                from .audio_processing import adjust_audio_speed
-
-                logger.info(f"Applying speed adjustment: {request.speed}x")
-                audio_data = adjust_audio_speed(
-                    audio_data,
-                    speed=request.speed,
-                    input_format=actual_format.value,
-                    output_format=actual_format.value,
-                )
-                speed_applied = True
-                # Adjust estimated duration based on speed
-                if estimated_duration:
-                    estimated_duration = estimated_duration / request.speed
-            except RuntimeError as e:
-                logger.warning(f"Speed adjustment failed: {e}")
-                # Continue without speed adjustment
-            except Exception as e:
-                logger.error(f"Unexpected error during speed adjustment: {e}")
-                # Continue without speed adjustment
-
-        # Convert format if needed (requires ffmpeg for non-MP3/WAV formats)
-        if actual_format != requested_format:
-            # Check if conversion is needed
-            if requested_format in [
-                AudioFormat.OPUS,
-                AudioFormat.AAC,
-                AudioFormat.FLAC,
-                AudioFormat.PCM,
-            ]:
-                try:
-                    from .audio_processing import convert_audio_format
-
-                    logger.info(
-                        f"Converting audio from {actual_format.value} to {requested_format.value}"
-                    )
-                    audio_data = convert_audio_format(
-                        audio_data,
-                        input_format=actual_format.value,
-                        output_format=requested_format.value,
-                    )
-                    actual_format = requested_format
-                    # Update content type after conversion
-                    content_type = self._get_content_type_for_format(requested_format)
-                    logger.info(f"Successfully converted to {requested_format.value}")
-                except RuntimeError as e:
-                    logger.warning(
-                        f"Format conversion failed: {e}. Returning {actual_format.value} format."
-                    )
-                    # Continue with original format
-                except Exception as e:
-                    logger.error(f"Unexpected error during format conversion: {e}")
-                    # Continue with original format
-            elif requested_format == AudioFormat.WAV and actual_format == AudioFormat.MP3:
-                # Convert MP3 to WAV if requested
-                try:
-                    from .audio_processing import convert_audio_format
-
-                    logger.info("Converting audio from MP3 to WAV")
-                    audio_data = convert_audio_format(
-                        audio_data,
-                        input_format="mp3",
-                        output_format="wav",
-                    )
-                    actual_format = AudioFormat.WAV
-                    # Update content type after conversion
-                    content_type = self._get_content_type_for_format(AudioFormat.WAV)
-                    logger.info("Successfully converted to WAV")
-                except RuntimeError as e:
-                    logger.warning(f"Format conversion failed: {e}. Returning MP3 format.")
-                except Exception as e:
-                    logger.error(f"Unexpected error during format conversion: {e}")
-
-        # Get voice value for logging
-        voice_value = request.voice.value if hasattr(request.voice, "value") else str(request.voice)
-
-        # Create response object
-        metadata = {
-            "response_headers": dict(response.headers),
-            "status_code": response.status_code,
-            "url": str(response.url),
-            "service": "openai.fm",
-            "voice": voice_value,
-            "original_text": (
-                request.input[:100] + "..." if len(request.input) > 100 else request.input
-            ),
-            "requested_format": (
-                requested_format.value
-                if isinstance(requested_format, AudioFormat)
-                else str(requested_format)
-            ),
-            "actual_format": (
-                actual_format.value
-                if isinstance(actual_format, AudioFormat)
-                else str(actual_format)
-            ),
-        }
-
-        # Add speed metadata if speed was requested
-        if request.speed is not None:
-            metadata["requested_speed"] = request.speed
-            metadata["speed_applied"] = speed_applied
-
-        tts_response = TTSResponse(
-            audio_data=audio_data,
-            content_type=content_type,
-            format=actual_format,
-            size=len(audio_data),
-            duration=estimated_duration,
-            metadata=metadata,
-        )
-
-        actual_format_str = (
-            actual_format.value if isinstance(actual_format, AudioFormat) else str(actual_format)
+        return build_tts_response(
+            _read_response_body(response),
+            request,
+            response.headers,
+            response.status_code,
+            str(response.url),
+            estimate_duration=self.estimate_duration,
+            include_response_headers=self.include_response_headers,
+            legacy_metadata=self.legacy_metadata,
         )
-        logger.info(
-            "Successfully generated %s of %s audio from openai.fm using voice %s",
-            format_file_size(len(audio_data)),
-            actual_format_str.upper(),
-            voice_value,
-        )
-
-        return tts_response
 
     def close(self) -> None:
         """Close the HTTP session."""
-        if hasattr(self, "session"):
+        # A shared session outlives its clients; other instances still use it
+        if hasattr(self, "session") and getattr(self, "_owns_session", True):
             self.session.close()
+        http2_client = getattr(self, "_http2_client", None)
+        if http2_client is not None:
+            http2_client.close()
 
     def __enter__(self):  # type: ignore[no-untyped-def]
         """Context manager entry."""
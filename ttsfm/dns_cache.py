@@ -0,0 +1,172 @@
+"""Connection-level tuning for the synchronous HTTP transport.
+
+``requests``/urllib3 resolve the host name every time a new connection is
+opened. This module provides a small TTL-bounded resolver cache and an
+``HTTPAdapter`` that routes connection setup through it, so a client that
+talks to a single host only pays for DNS once per TTL window. Both adapters
+also enable TCP keep-alive probes so idle pooled connections stay usable.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DNS_TTL = 300.0
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Probe after 60s idle, then every 15s, giving up after 4 misses. The
+    # option names are platform specific (macOS calls the idle one TCP_KEEPALIVE).
+    idle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    for name, value in ((idle, 60), (getattr(socket, "TCP_KEEPINTVL", None), 15)):
+        if name is not None:
+            options.append((socket.IPPROTO_TCP, name, value))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4))
+    return options
+
+
+KEEPALIVE_SOCKET_OPTIONS = _keepalive_socket_options()
+
+
+class DNSCache:
+    """Thread-safe ``getaddrinfo`` cache keyed by ``(host, port)``.
+
+    Attributes:
+        ttl: Seconds a resolved address list stays valid
+    """
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """Return the IP addresses for ``host``, resolving only on a cache miss.
+
+        Raises:
+            socket.gaierror: If the host cannot be resolved
+        """
+        key = (host, port)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        addresses: List[str] = []
+        for _family, _type, _proto, _canonname, sockaddr in socket.getaddrinfo(
+            host, port, 0, socket.SOCK_STREAM
+        ):
+            address = str(sockaddr[0])
+            if address not in addresses:
+                addresses.append(address)
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """Drop cached entries for ``host``, or every entry when ``host`` is None."""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == host]:
+                    del self._entries[key]
+
+
+class _CachedDNSHTTPConnection(HTTPConnection):
+    """HTTP connection that connects to cached addresses instead of re-resolving.
+
+    ``dns_cache`` is bound per adapter on the subclasses built by
+    :func:`_build_pool_classes`.
+    """
+
+    dns_cache: DNSCache
+
+    def _new_conn(self) -> socket.socket:
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except socket.gaierror:
+            # Let urllib3 perform the lookup and raise its usual error
+            return super()._new_conn()
+
+        error: Optional[Exception] = None
+        for address in addresses:
+            # urllib3 only uses _dns_host for the TCP connect; TLS server name
+            # checks happen after it is restored below.
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as exc:
+                error = exc
+            finally:
+                self._dns_host = host
+
+        self.dns_cache.invalidate(host)
+        if error is None:
+            return super()._new_conn()
+        logger.debug("All cached addresses for %s failed, dropped cache entry", host)
+        raise error
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSHTTPConnection, HTTPSConnection):
+    """HTTPS variant of :class:`_CachedDNSHTTPConnection`."""
+
+
+def _build_pool_classes(dns_cache: DNSCache) -> Dict[str, Type[HTTPConnectionPool]]:
+    attrs: Dict[str, Any] = {"dns_cache": dns_cache}
+    http_connection = type("CachedDNSHTTPConnection", (_CachedDNSHTTPConnection,), attrs)
+    https_connection = type("CachedDNSHTTPSConnection", (_CachedDNSHTTPSConnection,), attrs)
+    return {
+        "http": type(
+            "CachedDNSHTTPConnectionPool",
+            (HTTPConnectionPool,),
+            {"ConnectionCls": http_connection},
+        ),
+        "https": type(
+            "CachedDNSHTTPSConnectionPool",
+            (HTTPSConnectionPool,),
+            {"ConnectionCls": https_connection},
+        ),
+    }
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose connections enable TCP keep-alive probes."""
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        pool_kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
+class DNSCachingAdapter(KeepAliveAdapter):
+    """``KeepAliveAdapter`` whose connections resolve host names through a ``DNSCache``."""
+
+    def __init__(self, dns_cache: DNSCache, *args: Any, **kwargs: Any) -> None:
+        self.dns_cache = dns_cache
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = _build_pool_classes(self.dns_cache)
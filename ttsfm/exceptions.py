@@ -5,7 +5,12 @@ This module defines the exception hierarchy used throughout the package
 for consistent error handling and reporting.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
+
+from .utils import json_loads
+
+# Longest non-JSON error body kept as an exception message (e.g. CDN HTML pages)
+MAX_ERROR_MESSAGE_BYTES = 512
 
 
 class TTSException(Exception):
@@ -191,6 +196,44 @@ class AudioProcessingException(TTSException):
         self.audio_format = audio_format
 
 
+# Status codes with a dedicated exception class; the others raise APIException
+_EXCEPTIONS_BY_STATUS: Dict[int, Type[APIException]] = {
+    401: AuthenticationException,
+    402: QuotaExceededException,
+    429: RateLimitException,
+    503: ServiceUnavailableException,
+}
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+def parse_error_body(content_type: Optional[str], body: bytes) -> Dict[str, Any]:
+    """
+    Turn an error response body into the ``response_data`` of an exception.
+
+    Only JSON responses are decoded; anything else (typically an HTML error
+    page from a proxy) becomes a message truncated to
+    ``MAX_ERROR_MESSAGE_BYTES``.
+
+    Args:
+        content_type: Content-Type header of the response
+        body: Response body, or its first ``MAX_ERROR_MESSAGE_BYTES`` for non-JSON
+
+    Returns:
+        Dict[str, Any]: Decoded error payload with an ``error.message`` entry
+    """
+    if content_type and "json" in content_type.lower():
+        try:
+            data = json_loads(body)
+        except ValueError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
+
+    message = body[:MAX_ERROR_MESSAGE_BYTES].decode("utf-8", errors="replace").strip()
+    return {"error": {"message": message or "Unknown error"}}
+
+
 def create_exception_from_response(
     status_code: int, response_data: Dict[str, Any], default_message: str = "API request failed"
 ) -> APIException:
@@ -205,21 +248,16 @@ def create_exception_from_response(
     Returns:
         APIException: Appropriate exception instance
     """
-    message = response_data.get("error", {}).get("message", default_message)
-
-    if status_code == 401:
-        return AuthenticationException(message, response_data=response_data)
-    elif status_code == 402:
-        return QuotaExceededException(message, response_data=response_data)
-    elif status_code == 429:
-        retry_after = response_data.get("retry_after")
-        return RateLimitException(message, retry_after=retry_after, response_data=response_data)
-    elif status_code == 503:
-        retry_after = response_data.get("retry_after")
-        return ServiceUnavailableException(
-            message,
-            retry_after=retry_after,
-            response_data=response_data,
-        )
-    else:
+    try:
+        message = response_data["error"]["message"]
+    except (KeyError, TypeError):
+        message = default_message
+
+    exception_class = _EXCEPTIONS_BY_STATUS.get(status_code)
+    if exception_class is None:
         return APIException(message, status_code=status_code, response_data=response_data)
+    if status_code in _RETRY_AFTER_STATUSES:
+        return exception_class(
+            message, retry_after=response_data.get("retry_after"), response_data=response_data
+        )
+    return exception_class(message, response_data=response_data)
@@ -5,11 +5,15 @@ This module defines the core data structures used throughout the package,
 including request/response models, enums, and error types.
 """
 
+import copy
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional, Union
 
+from .utils import write_audio_file
+
 
 class Voice(str, Enum):
     """Available voice options for TTS generation."""
@@ -38,6 +42,13 @@ class AudioFormat(str, Enum):
     PCM = "pcm"
 
 
+# Plain dict lookups are much cheaper than calling the Enum class per request
+_VOICES_BY_VALUE: Dict[str, Voice] = {voice.value: voice for voice in Voice}
+_FORMATS_BY_VALUE: Dict[str, AudioFormat] = {fmt.value: fmt for fmt in AudioFormat}
+_VOICE_OPTIONS = ", ".join(_VOICES_BY_VALUE)
+_FORMAT_OPTIONS = ", ".join(_FORMATS_BY_VALUE)
+
+
 @dataclass
 class TTSRequest:
     """
@@ -67,21 +78,23 @@ class TTSRequest:
         """Validate and normalize fields after initialization."""
         if self.max_length > 1000:
             self.max_length = 1000
-        # Ensure voice is a valid Voice enum
-        if isinstance(self.voice, str):
-            try:
-                self.voice = Voice(self.voice.lower())
-            except ValueError:
-                raise ValueError(f"Invalid voice: {self.voice}. Must be one of {list(Voice)}")
+        # Ensure voice is a valid Voice enum (members are str too: skip them)
+        if isinstance(self.voice, str) and not isinstance(self.voice, Voice):
+            voice = _VOICES_BY_VALUE.get(self.voice.lower())
+            if voice is None:
+                raise ValueError(f"Invalid voice: {self.voice}. Must be one of: {_VOICE_OPTIONS}")
+            self.voice = voice
 
         # Ensure response_format is a valid AudioFormat enum
-        if isinstance(self.response_format, str):
-            try:
-                self.response_format = AudioFormat(self.response_format.lower())
-            except ValueError:
+        if isinstance(self.response_format, str) and not isinstance(
+            self.response_format, AudioFormat
+        ):
+            response_format = _FORMATS_BY_VALUE.get(self.response_format.lower())
+            if response_format is None:
                 raise ValueError(
-                    f"Invalid format: {self.response_format}. Must be one of {list(AudioFormat)}"
+                    f"Invalid format: {self.response_format}. Must be one of: {_FORMAT_OPTIONS}"
                 )
+            self.response_format = response_format
 
         # Validate input text
         if not self.input or not self.input.strip():
@@ -129,6 +142,24 @@ class TTSRequest:
 
         return data
 
+    def with_input(self, text: str) -> "TTSRequest":
+        """
+        Return a copy of this validated request carrying different input text.
+
+        The copy skips ``__post_init__``: voice, format and options were
+        already validated on this request, and the caller is responsible for
+        ``text`` being non-empty (e.g. a chunk from ``split_text_by_length``).
+
+        Args:
+            text: Input text for the new request
+
+        Returns:
+            TTSRequest: Shallow copy with ``input`` replaced
+        """
+        clone = copy.copy(self)
+        clone.input = text
+        return clone
+
 
 @dataclass
 class TTSResponse:
@@ -166,8 +197,6 @@ class TTSResponse:
         Returns:
             str: Final filename used
         """
-        import os
-
         # Use the actual returned format for the extension, not any requested format
         expected_extension = f".{self.format.value}"
 
@@ -185,14 +214,10 @@ class TTSResponse:
             final_filename = f"{base_name}{expected_extension}"
 
         # Create directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(final_filename) if os.path.dirname(final_filename) else ".",
-            exist_ok=True,
-        )
+        os.makedirs(os.path.dirname(final_filename) or ".", exist_ok=True)
 
         # Write audio data
-        with open(final_filename, "wb") as f:
-            f.write(self.audio_data)
+        write_audio_file(final_filename, self.audio_data)
 
         return final_filename
 
@@ -246,6 +271,20 @@ class ValidationError(TTSError):
     value: Optional[Any] = None
 
 
+# Prompt sent when a client is created with use_default_prompt=True
+DEFAULT_PROMPT = (
+    "Affect/personality: Natural and clear\n\n"
+    "Tone: Friendly and professional, creating a pleasant "
+    "listening experience.\n\n"
+    "Pronunciation: Clear, articulate, and steady, ensuring "
+    "each word is easily understood while maintaining a "
+    "natural, conversational flow.\n\n"
+    "Pause: Brief, purposeful pauses between sentences to "
+    "allow time for the listener to process the information.\n\n"
+    "Emotion: Warm and engaging, conveying the intended "
+    "message effectively."
+)
+
 # Content type mappings for audio formats
 CONTENT_TYPE_MAP = {
     AudioFormat.MP3: "audio/mpeg",
@@ -256,17 +295,30 @@ CONTENT_TYPE_MAP = {
     AudioFormat.PCM: "audio/pcm",
 }
 
-# Reverse mapping for content type to format
+_CONTENT_TYPE_BY_VALUE = {fmt.value: content_type for fmt, content_type in CONTENT_TYPE_MAP.items()}
+
+# Reverse mapping for content type to format, including common aliases
 FORMAT_FROM_CONTENT_TYPE = {v: k for k, v in CONTENT_TYPE_MAP.items()}
+FORMAT_FROM_CONTENT_TYPE.update(
+    {
+        "audio/mp3": AudioFormat.MP3,
+        "audio/x-wav": AudioFormat.WAV,
+        "audio/wave": AudioFormat.WAV,
+        "audio/ogg": AudioFormat.OPUS,
+    }
+)
 
 
 def get_content_type(format: Union[AudioFormat, str]) -> str:
     """Get MIME content type for audio format."""
-    if isinstance(format, str):
-        format = AudioFormat(format.lower())
-    return CONTENT_TYPE_MAP.get(format, "audio/mpeg")
+    # AudioFormat members are str, so one lowercased lookup covers both inputs
+    content_type = _CONTENT_TYPE_BY_VALUE.get(format.lower())
+    if content_type is None:
+        raise ValueError(f"{format!r} is not a valid AudioFormat")
+    return content_type
 
 
 def get_format_from_content_type(content_type: str) -> AudioFormat:
-    """Get audio format from MIME content type."""
-    return FORMAT_FROM_CONTENT_TYPE.get(content_type, AudioFormat.MP3)
+    """Get audio format from MIME content type, ignoring any parameters."""
+    mime_type = content_type.split(";", 1)[0].strip().lower()
+    return FORMAT_FROM_CONTENT_TYPE.get(mime_type, AudioFormat.MP3)
@@ -5,15 +5,21 @@ This module provides common utility functions used throughout the package,
 including HTTP helpers, validation utilities, and configuration management.
 """
 
+import json
 import logging
 import os
 import random
 import re
+from functools import lru_cache
 from html import unescape
-from itertools import cycle
-from threading import Lock
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin, urlparse
+from itertools import count
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+try:  # Optional dependency for faster JSON encoding/decoding
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -53,15 +59,11 @@ else:
 
 _LANGUAGE_OPTIONS = ["en-US,en;q=0.9", "en-GB,en;q=0.8", "en-CA,en;q=0.7"]
 _PLATFORM_OPTIONS = ['"Windows"', '"macOS"', '"Linux"']
-_LANGUAGE_CYCLE = cycle(_LANGUAGE_OPTIONS)
-_PLATFORM_CYCLE = cycle(_PLATFORM_OPTIONS)
-_LANGUAGE_LOCK = Lock()
-_PLATFORM_LOCK = Lock()
-_UPGRADE_TOGGLE = cycle([True, False])
-_UPGRADE_LOCK = Lock()
-
-_USER_AGENT_CYCLE = cycle(DEFAULT_USER_AGENTS)
-_USER_AGENT_LOCK = Lock()
+# Rotation counters: next() on itertools.count is atomic, so no lock is needed
+_LANGUAGE_COUNTER = count()
+_PLATFORM_COUNTER = count()
+_UPGRADE_COUNTER = count()
+_USER_AGENT_COUNTER = count()
 
 try:  # Optional dependency – only used when explicitly enabled
     if _USE_FAKE_USERAGENT:
@@ -84,6 +86,36 @@ QUOTE_CHAR_MAP.update(
 QUOTE_TRANSLATION = str.maketrans(QUOTE_CHAR_MAP)
 
 
+# HTTP statuses worth retrying: rate limiting and transient upstream failures
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document, using ``orjson`` when it is installed.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _fake_user_agent() -> Any:  # pragma: no cover - optional dependency
+    # Building UserAgent loads its browser database, so do it once per process;
+    # lru_cache does not cache a failed construction, which is retried next call
+    return UserAgent(fallback=DEFAULT_USER_AGENTS[0])
+
+
 def get_user_agent() -> str:
     """Return a realistic User-Agent string without requiring network access."""
     override = os.getenv("TTSFM_USER_AGENT")
@@ -93,81 +125,97 @@ def get_user_agent() -> str:
     if _USE_FAKE_USERAGENT and UserAgent is not None:  # pragma: no cover
         # Optional dependency required for dynamic user-agent generation
         try:
-            ua = UserAgent(fallback=DEFAULT_USER_AGENTS[0])
-            candidate = ua.random
+            candidate = _fake_user_agent().random
             if candidate:
                 return candidate
         except Exception as exc:  # pragma: no cover - fake_useragent instability
             logger.debug("fake-useragent lookup failed, using static list: %s", exc)
 
-    with _USER_AGENT_LOCK:
-        return next(_USER_AGENT_CYCLE)
+    return DEFAULT_USER_AGENTS[next(_USER_AGENT_COUNTER) % len(DEFAULT_USER_AGENTS)]
 
 
 def _next_language() -> str:
-    with _LANGUAGE_LOCK:
-        return next(_LANGUAGE_CYCLE)
+    return _LANGUAGE_OPTIONS[next(_LANGUAGE_COUNTER) % len(_LANGUAGE_OPTIONS)]
 
 
 def _next_platform() -> str:
-    with _PLATFORM_LOCK:
-        return next(_PLATFORM_CYCLE)
+    return _PLATFORM_OPTIONS[next(_PLATFORM_COUNTER) % len(_PLATFORM_OPTIONS)]
 
 
 def _upgrade_insecure_requests() -> bool:
     if _HEADER_RANDOM:
         return _HEADER_RANDOM.random() < 0.5
-    with _UPGRADE_LOCK:
-        return next(_UPGRADE_TOGGLE)
+    return next(_UPGRADE_COUNTER) % 2 == 0
+
+
+_CHROMIUM_VERSION_PATTERN = re.compile(r"(?:Chrome|Edge|Chromium)/(\d+)")
+
+
+@lru_cache(maxsize=32)
+def _client_hint_brands(user_agent: str) -> Optional[str]:
+    """Return the ``Sec-Ch-Ua`` value for a Chromium-based user agent, else None."""
+    if not any(browser in user_agent.lower() for browser in ["chrome", "edge", "chromium"]):
+        return None
+
+    version_match = _CHROMIUM_VERSION_PATTERN.search(user_agent)
+    major_version = version_match.group(1) if version_match else "121"
+
+    if "google chrome" in user_agent.lower():
+        brands = [
+            f'"Google Chrome";v="{major_version}"',
+            f'"Chromium";v="{major_version}"',
+            '"Not A(Brand";v="99"',
+        ]
+    elif "microsoft edge" in user_agent.lower():
+        brands = [
+            f'"Microsoft Edge";v="{major_version}"',
+            f'"Chromium";v="{major_version}"',
+            '"Not A(Brand";v="99"',
+        ]
+    else:
+        brands = [
+            f'"Chromium";v="{major_version}"',
+            '"Not A(Brand";v="8"',
+        ]
+
+    return ", ".join(brands)
+
+
+# Header templates in send order; the rotating values are filled in per call
+_BASE_HEADERS = {
+    "Accept": "application/json, audio/*",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "DNT": "1",
+    "Pragma": "no-cache",
+    "User-Agent": "",
+    "X-Requested-With": "XMLHttpRequest",
+}
+_CLIENT_HINT_HEADERS = {
+    "Sec-Ch-Ua": "",
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": "",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+}
 
 
 def get_realistic_headers(custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     """Generate HTTP headers that mimic a browser while remaining deterministic."""
     user_agent = get_user_agent()
 
-    headers = {
-        "Accept": "application/json, audio/*",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept-Language": _next_language(),
-        "Cache-Control": "no-cache",
-        "DNT": "1",
-        "Pragma": "no-cache",
-        "User-Agent": user_agent,
-        "X-Requested-With": "XMLHttpRequest",
-    }
+    headers = _BASE_HEADERS.copy()
+    headers["Accept-Language"] = _next_language()
+    headers["User-Agent"] = user_agent
 
-    if any(browser in user_agent.lower() for browser in ["chrome", "edge", "chromium"]):
-        version_match = re.search(r"(?:Chrome|Edge|Chromium)/(\d+)", user_agent)
-        major_version = version_match.group(1) if version_match else "121"
-
-        if "google chrome" in user_agent.lower():
-            brands = [
-                f'"Google Chrome";v="{major_version}"',
-                f'"Chromium";v="{major_version}"',
-                '"Not A(Brand";v="99"',
-            ]
-        elif "microsoft edge" in user_agent.lower():
-            brands = [
-                f'"Microsoft Edge";v="{major_version}"',
-                f'"Chromium";v="{major_version}"',
-                '"Not A(Brand";v="99"',
-            ]
-        else:
-            brands = [
-                f'"Chromium";v="{major_version}"',
-                '"Not A(Brand";v="8"',
-            ]
-
-        headers.update(
-            {
-                "Sec-Ch-Ua": ", ".join(brands),
-                "Sec-Ch-Ua-Mobile": "?0",
-                "Sec-Ch-Ua-Platform": _next_platform(),
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-            }
-        )
+    brands = _client_hint_brands(user_agent)
+    if brands is not None:
+        headers.update(_CLIENT_HINT_HEADERS)
+        headers["Sec-Ch-Ua"] = brands
+        headers["Sec-Ch-Ua-Platform"] = _next_platform()
 
     if _upgrade_insecure_requests():
         headers["Upgrade-Insecure-Requests"] = "1"
@@ -210,35 +258,18 @@ def validate_text_length(text: str, max_length: int = 1000, raise_error: bool =
     return True
 
 
-_SENTENCE_TERMINATORS = {".", "!", "?"}
+# A sentence is a run of text up to and including its terminators (".", "!", "?"),
+# or the unterminated tail of the text
+_SENTENCE_PATTERN = re.compile(r"[^.!?]*[.!?]+|[^.!?]+")
+_SENTENCE_TERMINATORS = (".", "!", "?")
 
 
 def _split_into_sentences(text: str) -> List[str]:
     sentences: List[str] = []
-    buffer: List[str] = []
-    length = len(text)
-    i = 0
-
-    while i < length:
-        char = text[i]
-        buffer.append(char)
-
-        if char in _SENTENCE_TERMINATORS:
-            j = i + 1
-            while j < length and text[j] in _SENTENCE_TERMINATORS:
-                buffer.append(text[j])
-                j += 1
-            sentence = "".join(buffer).strip()
-            if sentence:
-                sentences.append(sentence)
-            buffer = []
-            i = j - 1
-        i += 1
-
-    remainder = "".join(buffer).strip()
-    if remainder:
-        sentences.append(remainder)
-
+    for match in _SENTENCE_PATTERN.finditer(text):
+        sentence = match.group().strip()
+        if sentence:
+            sentences.append(sentence)
     return sentences
 
 
@@ -298,28 +329,35 @@ def _split_long_segment(segment: str, max_length: int) -> List[str]:
     return parts
 
 
-def split_text_by_length(
+def split_text_by_length_iter(
     text: str,
     max_length: int = 1000,
     preserve_words: bool = True,
-) -> List[str]:
-    """Split text into chunks no longer than ``max_length`` characters."""
+) -> Iterator[str]:
+    """Lazily yield chunks no longer than ``max_length`` characters.
+
+    Chunks are produced as soon as they are complete, so callers can start
+    working on the first chunk before the rest of the text has been split.
+    """
     if not text:
-        return []
+        return
 
     max_length = max(1, min(max_length, 1000))
 
     if len(text) <= max_length:
-        return [text]
-
-    chunks: List[str] = []
-
-    if preserve_words:
-        sentences = _split_into_sentences(text)
+        yield text
+        return
+
+    if preserve_words and not any(mark in text for mark in _SENTENCE_TERMINATORS):
+        # A single unterminated sentence: only the word splitter applies
+        segment = text.strip()
+        if segment:
+            yield from _split_long_segment(segment, max_length)
+    elif preserve_words:
         current_segment: List[str] = []
         current_length = 0
 
-        for sentence in sentences:
+        for sentence in _split_into_sentences(text):
             if not sentence:
                 continue
 
@@ -332,10 +370,12 @@ def split_text_by_length(
                 continue
 
             if current_segment:
-                chunks.append(" ".join(current_segment))
+                yield " ".join(current_segment)
 
             if len(sentence) > max_length:
-                chunks.extend(_split_long_segment(sentence, max_length))
+                for part in _split_long_segment(sentence, max_length):
+                    if part.strip():
+                        yield part
                 current_segment = []
                 current_length = 0
                 continue
@@ -344,14 +384,51 @@ def split_text_by_length(
             current_length = len(sentence)
 
         if current_segment:
-            chunks.append(" ".join(current_segment))
+            yield " ".join(current_segment)
     else:
         for i in range(0, len(text), max_length):
             chunk = text[i : i + max_length]
             if chunk.strip():
-                chunks.append(chunk)
+                yield chunk
+
+
+# Repeated long-text jobs re-split and re-sanitize the same input; these bound
+# how many recent results are memoized (at most the text size held per entry).
+_SPLIT_CACHE_SIZE = 32
+_SANITIZE_CACHE_SIZE = 128
+
 
-    return [chunk for chunk in chunks if chunk.strip()]
+@lru_cache(maxsize=_SPLIT_CACHE_SIZE)
+def _split_text_cached(text: str, max_length: int, preserve_words: bool) -> Tuple[str, ...]:
+    return tuple(split_text_by_length_iter(text, max_length, preserve_words))
+
+
+def split_text_by_length(
+    text: str,
+    max_length: int = 1000,
+    preserve_words: bool = True,
+) -> List[str]:
+    """Split text into chunks no longer than ``max_length`` characters."""
+    return list(_split_text_cached(text, max_length, preserve_words))
+
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+# Quote normalisation plus the characters that become spaces (nbsp and stray
+# angle brackets left after tag removal), applied in one translate pass
+_SANITIZE_TRANSLATION = str.maketrans({**QUOTE_CHAR_MAP, 0x00A0: " ", 0x003C: " ", 0x003E: " "})
+# Anything in ASCII text that sanitizing would change: entities, tags, backticks
+# (normalised to quotes), whitespace other than a single space, or runs of spaces
+_ASCII_NEEDS_SANITIZING = re.compile(r"[&<>`\t\n\x0b\x0c\r\x1c-\x1f]| {2}")
+
+
+@lru_cache(maxsize=_SANITIZE_CACHE_SIZE)
+def _sanitize_text_cached(text: str) -> str:
+    without_tags = _TAG_PATTERN.sub(" ", unescape(text))
+    cleaned = without_tags.translate(_SANITIZE_TRANSLATION)
+
+    # str.split() uses the same whitespace definition as \s, so this collapses
+    # runs and strips the ends in one C-level pass
+    return " ".join(cleaned.split())
 
 
 def sanitize_text(text: str) -> str:
@@ -362,15 +439,10 @@ def sanitize_text(text: str) -> str:
     if len(text) > 50000:
         raise ValueError("Input text too long for sanitization (max 50000 characters)")
 
-    normalized = unescape(text)
-    normalized = normalized.translate(QUOTE_TRANSLATION)
-    normalized = normalized.replace(" ", " ")
+    if text.isascii() and _ASCII_NEEDS_SANITIZING.search(text) is None:
+        return text.strip()
 
-    without_tags = re.sub(r"<[^>]+>", " ", normalized)
-    cleaned = without_tags.replace("<", " ").replace(">", " ")
-    cleaned = re.sub(r"\s+", " ", cleaned)
-
-    return cleaned.strip()
+    return _sanitize_text_cached(text)
 
 
 def validate_url(url: str) -> bool:
@@ -383,9 +455,13 @@ def validate_url(url: str) -> bool:
     Returns:
         bool: True if URL is valid, False otherwise
     """
+    # Both a scheme and a netloc are only possible with "scheme://host"
+    if not url or "://" not in url:
+        return False
+
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        result = urlsplit(url)
+        return bool(result.scheme and result.netloc)
     except Exception:
         return False
 
@@ -423,8 +499,8 @@ def get_random_delay(min_delay: float = 1.0, max_delay: float = 5.0) -> float:
     Returns:
         float: Random delay in seconds
     """
-    base_delay = random.uniform(min_delay, max_delay)
-    jitter = random.uniform(0.1, 0.5)
+    base_delay = min_delay + (max_delay - min_delay) * random.random()
+    jitter = 0.1 + 0.4 * random.random()
     return base_delay + jitter
 
 
@@ -440,8 +516,10 @@ def exponential_backoff(attempt: int, base_delay: float = 1.0, max_delay: float
     Returns:
         float: Delay in seconds
     """
-    delay = base_delay * (2**attempt)
-    jitter = random.uniform(0.1, 0.3) * delay
+    # Past 2**62 every delay is saturated anyway; capping the shift keeps huge
+    # attempt numbers from overflowing the float conversion
+    delay = base_delay * (1 << min(attempt, 62))
+    jitter = (0.1 + 0.2 * random.random()) * delay
     return min(delay + jitter, max_delay)
 
 
@@ -456,19 +534,26 @@ def load_config_from_env(prefix: str = "TTSFM_") -> Dict[str, Any]:
         Dict[str, Any]: Configuration dictionary
     """
     config: Dict[str, Any] = {}
+    prefix_length = len(prefix)
 
     for key, value in os.environ.items():
         if key.startswith(prefix):
-            config_key = key[len(prefix) :].lower()
-
-            # Try to convert to appropriate type
-            if value.lower() in ("true", "false"):
-                config[config_key] = value.lower() == "true"
-            elif value.isdigit():
-                config[config_key] = int(value)
-            elif "." in value and value.replace(".", "").isdigit():
-                config[config_key] = float(value)
-            else:
+            config_key = key[prefix_length:].lower()
+
+            # Try to convert to appropriate type; only plain digit strings become
+            # numbers, so values like "1e5", "inf" or "1.2.3" stay strings
+            lowered = value.lower()
+            if lowered in ("true", "false"):
+                config[config_key] = lowered == "true"
+                continue
+            try:
+                if value.isdigit():
+                    config[config_key] = int(value)
+                elif value.replace(".", "", 1).isdigit():
+                    config[config_key] = float(value)
+                else:
+                    config[config_key] = value
+            except ValueError:  # Non-ASCII digits such as "²"
                 config[config_key] = value
 
     return config
@@ -491,6 +576,36 @@ def setup_logging(
     logging.basicConfig(level=level, format=format_string, handlers=[logging.StreamHandler()])
 
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_audio_file(output_file: str, audio_data: bytes) -> None:
+    """Write a generated audio payload to disk.
+
+    The payload is already fully in memory, so it is written straight to the
+    file descriptor instead of going through Python's buffered file layer.
+    """
+    # Same mode as open(): the process umask decides the final permissions
+    fd = os.open(output_file, _WRITE_FLAGS, 0o666)
+    try:
+        if hasattr(os, "posix_fallocate") and audio_data:
+            try:
+                os.posix_fallocate(fd, 0, len(audio_data))
+            except OSError:
+                pass  # Not supported by every filesystem; the write still works
+
+        view = memoryview(audio_data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+# ASCII separators str.split() honours besides a lone space, plus double spaces
+_NON_SPACE_SEPARATORS = ("  ", "\t", "\n", "\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x1f")
+
+
 def estimate_audio_duration(text: str, words_per_minute: float = 150.0) -> float:
     """
     Estimate audio duration based on text length.
@@ -505,8 +620,13 @@ def estimate_audio_duration(text: str, words_per_minute: float = 150.0) -> float
     if not text:
         return 0.0
 
-    # Count words (simple whitespace split)
-    word_count = len(text.split())
+    # Sanitized input is ASCII words separated by single spaces; counting the
+    # gaps gives the same answer as split() without building the word list
+    if text.isascii() and not any(mark in text for mark in _NON_SPACE_SEPARATORS):
+        stripped = text.strip(" ")
+        word_count = stripped.count(" ") + 1 if stripped else 0
+    else:
+        word_count = len(text.split())
 
     # Calculate duration in seconds
     duration = (word_count / words_per_minute) * 60.0
@@ -515,6 +635,9 @@ def estimate_audio_duration(text: str, words_per_minute: float = 150.0) -> float
     return duration * 1.1
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -528,12 +651,6 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    size_float = float(size_bytes)
-
-    while size_float >= 1024 and i < len(size_names) - 1:
-        size_float /= 1024.0
-        i += 1
-
-    return f"{size_float:.1f} {size_names[i]}"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit = min((size_bytes.bit_length() - 1) // 10, 3) if size_bytes > 0 else 0
+    return f"{size_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"